@@ -0,0 +1,23 @@
+// JD aging helpers.
+//
+// Aging is derived from created_at when a row is read instead of being stored
+// and rewritten by a nightly sweep. Days are counted between UTC calendar
+// dates, matching DATEDIFF(CURDATE(), DATE(jd_created_date)).
+
+const DAY_MS = 24 * 60 * 60 * 1000;
+
+const startOfUtcDay = (date) => Date.UTC(date.getUTCFullYear(), date.getUTCMonth(), date.getUTCDate());
+
+const agingDays = (createdAt, now = new Date()) => {
+  if (!createdAt) {
+    return 0;
+  }
+  return Math.max(0, Math.round((startOfUtcDay(now) - startOfUtcDay(new Date(createdAt))) / DAY_MS));
+};
+
+// Rows created before the returned timestamp are at least `days` old.
+// Because rows are stored in created_at order, this turns an aging filter into
+// a range on created_at that can be located with a binary search.
+const agingCutoff = (days, now = new Date()) => new Date(startOfUtcDay(now) - (days - 1) * DAY_MS).toISOString();
+
+module.exports = { agingDays, agingCutoff };
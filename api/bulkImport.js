@@ -0,0 +1,246 @@
+// Streaming bulk import of job descriptions from CSV or JSONL.
+//
+// Records are parsed as the input arrives, validated with the JD form rules,
+// and written to the store in chunks, so memory use depends on the chunk size
+// rather than the file size. Customer, mode, category and user names are
+// resolved to ids through lookup maps built once per import.
+
+const readline = require('readline');
+const { validateJobData } = require('./validation');
+
+const DEFAULT_CHUNK_SIZE = 1000;
+
+const NUMERIC_FIELDS = [
+  'jd_customer_id', 'jd_skillset_cat', 'jd_mode', 'jd_tenure',
+  'jd_op_exp_min', 'jd_op_exp_max', 'jd_op_budget_min', 'jd_op_budget_max',
+  'jd_open_position', 'jd_created_by', 'jd_updated_by',
+];
+
+// Accepted spellings of the TINYINT(1)/BOOLEAN jd_active column. CSV cells
+// are strings, and "false" or "0" left as-is would count as active.
+const BOOLEAN_VALUES = {
+  true: true, false: false, 1: true, 0: false, yes: true, no: false,
+};
+
+// Name column -> [id column, reference table, id key, name keys]
+const NAME_LOOKUPS = {
+  customer_name: ['jd_customer_id', 'customers', 'customer_id', ['customer_name', 'customer_code']],
+  mode_name: ['jd_mode', 'engagement_modes', 'mode_id', ['mode_name']],
+  category_name: ['jd_skillset_cat', 'skillset_categories', 'category_id', ['category_name']],
+  created_by_username: ['jd_created_by', 'users', 'user_id', ['username']],
+};
+
+// Yields { line, fields } per CSV record, where line is the physical line
+// the record starts on. Quoted fields may contain commas, escaped quotes ("")
+// and newlines, and may span chunk boundaries.
+async function* csvRecords(stream) {
+  let line = 1;
+  let recordLine = 1;
+  let record = [];
+  let field = '';
+  let inQuotes = false;
+  let closedQuote = false;
+
+  for await (const chunk of stream) {
+    const text = typeof chunk === 'string' ? chunk : chunk.toString('utf8');
+    for (let i = 0; i < text.length; i++) {
+      const ch = text[i];
+      if (inQuotes) {
+        if (ch === '"') {
+          inQuotes = false;
+          closedQuote = true;
+        } else {
+          if (ch === '\n') {
+            line += 1;
+          }
+          field += ch;
+        }
+        continue;
+      }
+      if (ch === '"') {
+        // A quote straight after a closing quote is an escaped quote
+        if (closedQuote) {
+          field += '"';
+        }
+        inQuotes = true;
+        closedQuote = false;
+        continue;
+      }
+      closedQuote = false;
+      if (ch === ',') {
+        record.push(field);
+        field = '';
+      } else if (ch === '\n') {
+        record.push(field);
+        field = '';
+        yield { line: recordLine, fields: record };
+        record = [];
+        line += 1;
+        recordLine = line;
+      } else if (ch !== '\r') {
+        field += ch;
+      }
+    }
+  }
+
+  if (field !== '' || record.length > 0) {
+    record.push(field);
+    yield { line: recordLine, fields: record };
+  }
+}
+
+// Yields { line, row } objects from CSV (header row gives the keys) or JSONL
+async function* readRows(stream, format) {
+  if (format === 'jsonl') {
+    let line = 0;
+    for await (const text of readline.createInterface({ input: stream, crlfDelay: Infinity })) {
+      line += 1;
+      if (!text.trim()) {
+        continue;
+      }
+      try {
+        yield { line, row: JSON.parse(text) };
+      } catch (error) {
+        yield { line, error: `Invalid JSON: ${error.message}` };
+      }
+    }
+    return;
+  }
+
+  let header = null;
+  for await (const { line, fields: record } of csvRecords(stream)) {
+    if (record.length === 1 && record[0].trim() === '') {
+      continue;
+    }
+    if (!header) {
+      header = record.map((name) => name.trim());
+      continue;
+    }
+    const row = {};
+    header.forEach((name, index) => {
+      if (record[index] !== undefined && record[index] !== '') {
+        row[name] = record[index];
+      }
+    });
+    yield { line, row };
+  }
+}
+
+// Accepts JSON arrays, or comma/semicolon separated lists from CSV cells
+const parseList = (value) => {
+  if (value == null || Array.isArray(value)) {
+    return value;
+  }
+  const text = String(value).trim();
+  if (text.startsWith('[')) {
+    try {
+      return JSON.parse(text);
+    } catch {
+      // Fall through and treat it as a plain list
+    }
+  }
+  return text.split(/[;,]/).map((item) => item.trim()).filter(Boolean);
+};
+
+const buildLookups = (store) => Object.fromEntries(
+  Object.entries(NAME_LOOKUPS).map(([column, [, table, idKey, nameKeys]]) => {
+    const map = new Map();
+    store.listTable(table).forEach((row) => {
+      nameKeys.forEach((key) => map.set(String(row[key]).toLowerCase(), row[idKey]));
+    });
+    return [column, map];
+  })
+);
+
+// Returns the row ready for insertion, or the list of problems with it
+const normalizeRow = (raw, lookups) => {
+  // Starts with a fixed key, like buildRow in store.js: a bare `{ ...raw }`
+  // gets a hidden class of its own, and every property added to it below then
+  // costs a new one. jd_title is required, so the key is there anyway.
+  const row = { jd_title: undefined, ...raw };
+  const errors = [];
+
+  Object.entries(NAME_LOOKUPS).forEach(([column, [idColumn]]) => {
+    if (row[column] != null && row[idColumn] == null) {
+      const id = lookups[column].get(String(row[column]).trim().toLowerCase());
+      if (id == null) {
+        errors.push(`Unknown ${column.replace(/_/g, ' ')}: ${row[column]}`);
+      } else {
+        row[idColumn] = id;
+      }
+    }
+    delete row[column];
+  });
+
+  NUMERIC_FIELDS.forEach((field) => {
+    if (row[field] != null && row[field] !== '') {
+      row[field] = Number(row[field]);
+    }
+  });
+  if (row.jd_active != null && row.jd_active !== '') {
+    const active = BOOLEAN_VALUES[String(row.jd_active).trim().toLowerCase()];
+    if (active === undefined) {
+      errors.push(`Active must be true or false: ${row.jd_active}`);
+    } else {
+      row.jd_active = active;
+    }
+  }
+  row.jd_skillset = parseList(row.jd_skillset);
+  row.jd_keywords = parseList(row.jd_keywords);
+  row.jd_status = row.jd_status || 'Open';
+  row.jd_updated_by = row.jd_updated_by || row.jd_created_by;
+
+  const { errors: validationErrors } = validateJobData(row);
+  errors.push(...validationErrors);
+
+  return errors.length ? { errors } : { row };
+};
+
+// Imports rows from `stream` into `store`. Resolves to a summary with the
+// per-row error report; rows with errors are skipped, the rest are written.
+const importJobs = async (stream, store, { format = 'csv', chunkSize = DEFAULT_CHUNK_SIZE } = {}) => {
+  const started = process.hrtime.bigint();
+  const lookups = buildLookups(store);
+  const errors = [];
+  let chunk = [];
+  let total = 0;
+  let imported = 0;
+
+  const flush = () => {
+    if (chunk.length) {
+      store.insertJobs(chunk);
+      imported += chunk.length;
+      chunk = [];
+    }
+  };
+
+  for await (const { line, row, error } of readRows(stream, format)) {
+    total += 1;
+    if (error) {
+      errors.push({ line, errors: [error] });
+      continue;
+    }
+    const result = normalizeRow(row, lookups);
+    if (result.errors) {
+      errors.push({ line, errors: result.errors });
+      continue;
+    }
+    chunk.push(result.row);
+    if (chunk.length >= chunkSize) {
+      flush();
+    }
+  }
+  flush();
+
+  const elapsedMs = Number(process.hrtime.bigint() - started) / 1e6;
+  return {
+    total,
+    imported,
+    failed: errors.length,
+    elapsed_ms: Number(elapsedMs.toFixed(1)),
+    rows_per_second: elapsedMs > 0 ? Math.round((imported / elapsedMs) * 1000) : imported,
+    errors,
+  };
+};
+
+module.exports = { importJobs };
@@ -0,0 +1,308 @@
+// Streaming CSV / XLSX / JSONL export of job descriptions.
+//
+// Rows arrive in chunks and are written to the response as they are
+// formatted, waiting for 'drain' when the client is slower than we are, so
+// memory use does not grow with the number of rows. Customer, category, mode
+// and user names come from lookup maps built once per export.
+
+const { once } = require('events');
+const { agingDays } = require('./aging');
+
+const EXPORT_FORMATS = {
+  csv: { contentType: 'text/csv; charset=utf-8', extension: 'csv' },
+  jsonl: { contentType: 'application/x-ndjson; charset=utf-8', extension: 'jsonl' },
+  xlsx: { contentType: 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet', extension: 'xlsx' },
+};
+
+// [key, header, value getter] in export order. CSV and XLSX use the headers;
+// JSONL uses the keys, which are the job_descriptions column names (the name
+// columns match the ones the bulk importer accepts).
+const COLUMNS = [
+  ['id', 'ID', (jd) => jd.id],
+  ['jd_title', 'Title', (jd) => jd.jd_title],
+  ['customer_name', 'Customer', (jd, names) => names.customers.get(Number(jd.jd_customer_id))],
+  ['jd_consumer', 'Consumer', (jd) => jd.jd_consumer],
+  ['category_name', 'Skillset Category', (jd, names) => names.categories.get(Number(jd.jd_skillset_cat))],
+  ['jd_skillset', 'Skills', (jd) => asList(jd.jd_skillset)],
+  ['mode_name', 'Mode', (jd, names) => names.modes.get(Number(jd.jd_mode))],
+  ['jd_tenure', 'Tenure (months)', (jd) => jd.jd_tenure],
+  ['jd_op_exp_min', 'Experience Min', (jd) => jd.jd_op_exp_min],
+  ['jd_op_exp_max', 'Experience Max', (jd) => jd.jd_op_exp_max],
+  ['jd_op_budget_min', 'Budget Min', (jd) => jd.jd_op_budget_min],
+  ['jd_op_budget_max', 'Budget Max', (jd) => jd.jd_op_budget_max],
+  ['jd_open_position', 'Open Positions', (jd) => jd.jd_open_position],
+  ['jd_available_pos', 'Available Positions', (jd) => jd.jd_available_pos],
+  ['jd_revenue_potential', 'Revenue Potential', (jd) => jd.jd_revenue_potential],
+  ['jd_keywords', 'Keywords', (jd) => asList(jd.jd_keywords)],
+  ['jd_status', 'Status', (jd) => jd.jd_status],
+  ['jd_aging', 'Aging (days)', (jd, names, now) => agingDays(jd.created_at, now)],
+  ['created_by_name', 'Created By', (jd, names) => names.users.get(Number(jd.jd_created_by))],
+  ['created_at', 'Created At', (jd) => jd.created_at],
+];
+
+const buildNameMaps = (store) => ({
+  customers: new Map(store.listTable('customers').map((row) => [row.customer_id, row.customer_name])),
+  categories: new Map(store.listTable('skillset_categories').map((row) => [row.category_id, row.category_name])),
+  modes: new Map(store.listTable('engagement_modes').map((row) => [row.mode_id, row.mode_name])),
+  users: new Map(store.listTable('users').map((row) => [row.user_id, row.full_name])),
+});
+
+// JSON columns may hold an array or its string form
+const asList = (value) => {
+  if (typeof value === 'string' && value.startsWith('[')) {
+    try {
+      return JSON.parse(value);
+    } catch {
+      return value;
+    }
+  }
+  return value;
+};
+
+// Arrays become "a; b; c" for the flat formats
+const flatten = (value) => (Array.isArray(value) ? value.join('; ') : value);
+
+// CSV
+
+const csvCell = (value) => {
+  if (value == null) {
+    return '';
+  }
+  let text = String(value);
+  // Stop spreadsheet apps from evaluating text cells as formulas
+  if (typeof value === 'string' && /^[=+\-@]/.test(text)) {
+    text = `'${text}`;
+  }
+  return /[",\r\n]/.test(text) ? `"${text.replace(/"/g, '""')}"` : text;
+};
+
+const csvWriter = () => ({
+  begin: () => `${COLUMNS.map(([, header]) => csvCell(header)).join(',')}\r\n`,
+  rows: (rows) => rows.map((values) => `${values.map((value) => csvCell(flatten(value))).join(',')}\r\n`).join(''),
+  end: () => '',
+});
+
+// JSONL keeps arrays as arrays and uses the column keys
+
+const jsonlWriter = () => ({
+  begin: () => '',
+  rows: (rows) => rows.map((values) => `${JSON.stringify(Object.fromEntries(values.map((value, i) => [COLUMNS[i][0], value ?? null])))}\n`).join(''),
+  end: () => '',
+});
+
+// XLSX: a zip of a few fixed XML parts plus one worksheet that is streamed.
+// Entries are stored uncompressed; the worksheet uses a data descriptor since
+// its size and CRC are only known at the end. No ZIP64, so exports must stay
+// under 4 GB.
+
+const CRC_TABLE = new Int32Array(256).map((_, n) => {
+  let c = n;
+  for (let k = 0; k < 8; k++) {
+    c = c & 1 ? 0xedb88320 ^ (c >>> 1) : c >>> 1;
+  }
+  return c;
+});
+
+const crc32 = (buffer, crc = 0) => {
+  let c = crc ^ -1;
+  for (let i = 0; i < buffer.length; i++) {
+    c = CRC_TABLE[(c ^ buffer[i]) & 0xff] ^ (c >>> 8);
+  }
+  return (c ^ -1) >>> 0;
+};
+
+const dosDateTime = (date) => ({
+  time: (date.getHours() << 11) | (date.getMinutes() << 5) | (date.getSeconds() >> 1),
+  date: ((date.getFullYear() - 1980) << 9) | ((date.getMonth() + 1) << 5) | date.getDate(),
+});
+
+const createZipWriter = (now) => {
+  const { time, date } = dosDateTime(now);
+  const entries = [];
+  let offset = 0;
+  let current = null;
+
+  const localHeader = (name, flags, crc, size) => {
+    const nameBuffer = Buffer.from(name);
+    const header = Buffer.alloc(30);
+    header.writeUInt32LE(0x04034b50, 0);
+    header.writeUInt16LE(20, 4);
+    header.writeUInt16LE(flags, 6);
+    header.writeUInt16LE(0, 8);
+    header.writeUInt16LE(time, 10);
+    header.writeUInt16LE(date, 12);
+    header.writeUInt32LE(crc, 14);
+    header.writeUInt32LE(size, 18);
+    header.writeUInt32LE(size, 22);
+    header.writeUInt16LE(nameBuffer.length, 26);
+    header.writeUInt16LE(0, 28);
+    return Buffer.concat([header, nameBuffer]);
+  };
+
+  const track = (buffer) => {
+    offset += buffer.length;
+    return buffer;
+  };
+
+  return {
+    // Small entry whose content is known up front
+    file: (name, content) => {
+      const data = Buffer.from(content);
+      const crc = crc32(data);
+      entries.push({ name, crc, size: data.length, offset, flags: 0 });
+      return track(Buffer.concat([localHeader(name, 0, crc, data.length), data]));
+    },
+
+    // Streamed entry: begin, then data chunks, then finish
+    begin: (name) => {
+      current = { name, crc: 0, size: 0, offset, flags: 0x08 };
+      return track(localHeader(name, 0x08, 0, 0));
+    },
+
+    data: (content) => {
+      const data = Buffer.from(content);
+      current.crc = crc32(data, current.crc);
+      current.size += data.length;
+      return track(data);
+    },
+
+    finish: () => {
+      const descriptor = Buffer.alloc(16);
+      descriptor.writeUInt32LE(0x08074b50, 0);
+      descriptor.writeUInt32LE(current.crc, 4);
+      descriptor.writeUInt32LE(current.size, 8);
+      descriptor.writeUInt32LE(current.size, 12);
+      entries.push(current);
+      current = null;
+      return track(descriptor);
+    },
+
+    // Central directory and end record
+    close: () => {
+      const start = offset;
+      const records = entries.map((entry) => {
+        const nameBuffer = Buffer.from(entry.name);
+        const record = Buffer.alloc(46);
+        record.writeUInt32LE(0x02014b50, 0);
+        record.writeUInt16LE(20, 4);
+        record.writeUInt16LE(20, 6);
+        record.writeUInt16LE(entry.flags, 8);
+        record.writeUInt16LE(0, 10);
+        record.writeUInt16LE(time, 12);
+        record.writeUInt16LE(date, 14);
+        record.writeUInt32LE(entry.crc, 16);
+        record.writeUInt32LE(entry.size, 20);
+        record.writeUInt32LE(entry.size, 24);
+        record.writeUInt16LE(nameBuffer.length, 28);
+        record.writeUInt32LE(entry.offset, 42);
+        return Buffer.concat([record, nameBuffer]);
+      });
+      const directory = Buffer.concat(records);
+      const end = Buffer.alloc(22);
+      end.writeUInt32LE(0x06054b50, 0);
+      end.writeUInt16LE(entries.length, 8);
+      end.writeUInt16LE(entries.length, 10);
+      end.writeUInt32LE(directory.length, 12);
+      end.writeUInt32LE(start, 16);
+      return track(Buffer.concat([directory, end]));
+    },
+  };
+};
+
+const XML_HEADER = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n';
+const SPREADSHEET_NS = 'http://schemas.openxmlformats.org/spreadsheetml/2006/main';
+const RELATIONSHIPS_NS = 'http://schemas.openxmlformats.org/package/2006/relationships';
+const OFFICE_RELATIONSHIPS = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships';
+
+const XLSX_PARTS = {
+  '[Content_Types].xml': `${XML_HEADER}<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">`
+    + '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    + '<Default Extension="xml" ContentType="application/xml"/>'
+    + '<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    + '<Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+    + '</Types>',
+  '_rels/.rels': `${XML_HEADER}<Relationships xmlns="${RELATIONSHIPS_NS}">`
+    + `<Relationship Id="rId1" Type="${OFFICE_RELATIONSHIPS}/officeDocument" Target="xl/workbook.xml"/>`
+    + '</Relationships>',
+  'xl/workbook.xml': `${XML_HEADER}<workbook xmlns="${SPREADSHEET_NS}" xmlns:r="${OFFICE_RELATIONSHIPS}">`
+    + '<sheets><sheet name="Job Descriptions" sheetId="1" r:id="rId1"/></sheets>'
+    + '</workbook>',
+  'xl/_rels/workbook.xml.rels': `${XML_HEADER}<Relationships xmlns="${RELATIONSHIPS_NS}">`
+    + `<Relationship Id="rId1" Type="${OFFICE_RELATIONSHIPS}/worksheet" Target="worksheets/sheet1.xml"/>`
+    + '</Relationships>',
+};
+
+const xmlEscape = (text) => text
+  // Control characters are not allowed in XML 1.0
+  .replace(/[\x00-\x08\x0b\x0c\x0e-\x1f]/g, '')
+  .replace(/&/g, '&amp;')
+  .replace(/</g, '&lt;')
+  .replace(/>/g, '&gt;')
+  .replace(/"/g, '&quot;');
+
+const xlsxCell = (value) => {
+  if (value == null || value === '') {
+    return '<c/>';
+  }
+  if (typeof value === 'number' && Number.isFinite(value)) {
+    return `<c><v>${value}</v></c>`;
+  }
+  return `<c t="inlineStr"><is><t xml:space="preserve">${xmlEscape(String(value))}</t></is></c>`;
+};
+
+const xlsxRow = (values) => `<row>${values.map(xlsxCell).join('')}</row>`;
+
+const xlsxWriter = (now) => {
+  const zip = createZipWriter(now);
+  return {
+    begin: () => Buffer.concat([
+      ...Object.entries(XLSX_PARTS).map(([name, content]) => zip.file(name, content)),
+      zip.begin('xl/worksheets/sheet1.xml'),
+      zip.data(`${XML_HEADER}<worksheet xmlns="${SPREADSHEET_NS}"><sheetData>${xlsxRow(COLUMNS.map(([, header]) => header))}`),
+    ]),
+    rows: (rows) => zip.data(rows.map((values) => xlsxRow(values.map(flatten))).join('')),
+    end: () => Buffer.concat([zip.data('</sheetData></worksheet>'), zip.finish(), zip.close()]),
+  };
+};
+
+const WRITERS = { csv: csvWriter, jsonl: jsonlWriter, xlsx: xlsxWriter };
+
+// Writes every chunk yielded by `chunks` (arrays of job rows) to `res` in the
+// given format. Stops early if the client goes away.
+const streamExport = async (res, chunks, { format, store, now = new Date() }) => {
+  const writer = WRITERS[format](now);
+  const names = buildNameMaps(store);
+  let closed = false;
+  res.on('close', () => {
+    closed = true;
+  });
+
+  const write = async (content) => {
+    if (content.length && !res.write(content) && !closed) {
+      // Whichever event loses the race would otherwise keep its listeners
+      // (plus once()'s error listener) on res for the rest of the export
+      const controller = new AbortController();
+      try {
+        await Promise.race([
+          once(res, 'drain', { signal: controller.signal }),
+          once(res, 'close', { signal: controller.signal }),
+        ]);
+      } finally {
+        controller.abort();
+      }
+    }
+  };
+
+  await write(writer.begin());
+  for (const chunk of chunks) {
+    if (closed) {
+      return;
+    }
+    await write(writer.rows(chunk.map((jd) => COLUMNS.map(([, , read]) => read(jd, names, now)))));
+    // Let other requests run between chunks
+    await new Promise((resolve) => setImmediate(resolve));
+  }
+  res.end(writer.end());
+};
+
+module.exports = { streamExport, EXPORT_FORMATS };
@@ -0,0 +1,475 @@
+// Local extraction engine behind POST /api/jd/scan.
+//
+// Skills and keywords are found in a single pass with an Aho-Corasick automaton
+// built from the dictionary below; experience, budget, tenure and mode come from
+// regular expressions. Results are cached by content hash, and batches larger
+// than a handful of documents are spread across a worker thread pool.
+
+const crypto = require('crypto');
+const os = require('os');
+const path = require('path');
+const { Worker } = require('worker_threads');
+
+// Canonical skill -> [aliases, skillset category]
+const SKILLS = {
+  React: [['react', 'reactjs', 'react.js'], 'Frontend Development'],
+  Angular: [['angular', 'angularjs'], 'Frontend Development'],
+  'Vue.js': [['vue', 'vuejs', 'vue.js'], 'Frontend Development'],
+  JavaScript: [['javascript', 'js', 'es6'], 'Frontend Development'],
+  TypeScript: [['typescript'], 'Frontend Development'],
+  HTML: [['html', 'html5'], 'Frontend Development'],
+  CSS: [['css', 'css3'], 'Frontend Development'],
+  Sass: [['sass', 'scss'], 'Frontend Development'],
+  Redux: [['redux'], 'Frontend Development'],
+  'Next.js': [['next.js', 'nextjs'], 'Frontend Development'],
+  'Tailwind CSS': [['tailwind', 'tailwindcss', 'tailwind css'], 'Frontend Development'],
+  'Node.js': [['node', 'nodejs', 'node.js'], 'Backend Development'],
+  Express: [['express', 'expressjs', 'express.js'], 'Backend Development'],
+  Java: [['java'], 'Backend Development'],
+  Spring: [['spring'], 'Backend Development'],
+  'Spring Boot': [['spring boot', 'springboot'], 'Backend Development'],
+  Python: [['python'], 'Backend Development'],
+  Django: [['django'], 'Backend Development'],
+  Flask: [['flask'], 'Backend Development'],
+  FastAPI: [['fastapi'], 'Backend Development'],
+  Go: [['golang'], 'Backend Development'],
+  'C#': [['c#'], 'Backend Development'],
+  '.NET': [['.net', 'dotnet', 'asp.net'], 'Backend Development'],
+  'C++': [['c++'], 'Backend Development'],
+  Ruby: [['ruby'], 'Backend Development'],
+  'Ruby on Rails': [['ruby on rails', 'rails'], 'Backend Development'],
+  PHP: [['php'], 'Backend Development'],
+  Laravel: [['laravel'], 'Backend Development'],
+  GraphQL: [['graphql'], 'Backend Development'],
+  SQL: [['sql'], 'Backend Development'],
+  MySQL: [['mysql'], 'Backend Development'],
+  PostgreSQL: [['postgresql', 'postgres'], 'Backend Development'],
+  MongoDB: [['mongodb', 'mongo'], 'Backend Development'],
+  Redis: [['redis'], 'Backend Development'],
+  Kafka: [['kafka', 'apache kafka'], 'Backend Development'],
+  RabbitMQ: [['rabbitmq'], 'Backend Development'],
+  Docker: [['docker'], 'DevOps'],
+  Kubernetes: [['kubernetes', 'k8s'], 'DevOps'],
+  AWS: [['aws', 'amazon web services'], 'DevOps'],
+  Azure: [['azure'], 'DevOps'],
+  GCP: [['gcp', 'google cloud'], 'DevOps'],
+  Terraform: [['terraform'], 'DevOps'],
+  Jenkins: [['jenkins'], 'DevOps'],
+  Ansible: [['ansible'], 'DevOps'],
+  Linux: [['linux'], 'DevOps'],
+  'Machine Learning': [['machine learning'], 'Data Science'],
+  'Deep Learning': [['deep learning'], 'Data Science'],
+  TensorFlow: [['tensorflow'], 'Data Science'],
+  PyTorch: [['pytorch'], 'Data Science'],
+  Pandas: [['pandas'], 'Data Science'],
+  NumPy: [['numpy'], 'Data Science'],
+  'scikit-learn': [['scikit-learn', 'sklearn'], 'Data Science'],
+  Spark: [['spark', 'apache spark', 'pyspark'], 'Data Science'],
+  Tableau: [['tableau'], 'Data Science'],
+  'Power BI': [['power bi', 'powerbi'], 'Data Science'],
+  NLP: [['nlp', 'natural language processing'], 'Data Science'],
+  Android: [['android'], 'Mobile Development'],
+  iOS: [['ios'], 'Mobile Development'],
+  Kotlin: [['kotlin'], 'Mobile Development'],
+  Swift: [['swift'], 'Mobile Development'],
+  Flutter: [['flutter'], 'Mobile Development'],
+  Dart: [['dart'], 'Mobile Development'],
+  'React Native': [['react native'], 'Mobile Development'],
+};
+
+// Canonical keyword -> aliases
+const KEYWORDS = {
+  Frontend: ['frontend', 'front-end', 'front end'],
+  Backend: ['backend', 'back-end', 'back end'],
+  'Full Stack': ['full stack', 'full-stack', 'fullstack'],
+  Microservices: ['microservices', 'microservice'],
+  'REST APIs': ['rest', 'restful', 'rest api', 'rest apis'],
+  Agile: ['agile'],
+  Scrum: ['scrum'],
+  'CI/CD': ['ci/cd', 'cicd', 'continuous integration'],
+  'Unit Testing': ['unit testing', 'unit tests', 'jest', 'junit'],
+  TDD: ['tdd', 'test-driven development', 'test driven development'],
+  Git: ['git', 'github', 'gitlab'],
+  'UI/UX': ['ui/ux', 'ux', 'user experience'],
+  'State Management': ['state management'],
+  'Component Development': ['reusable components', 'component development'],
+  Cloud: ['cloud'],
+  'System Design': ['system design', 'architecture'],
+  Security: ['security'],
+  Leadership: ['leadership', 'mentoring', 'team lead'],
+};
+
+// Aliases that are also everyday English words ("react to feedback", "spring
+// intake", "swift delivery", "rest of the team"). They only count when another
+// dictionary term is within CONTEXT_WINDOW characters; the qualified forms
+// (react.js, express.js, spring boot, apache spark, ...) always count.
+const AMBIGUOUS_ALIASES = new Set([
+  'react', 'express', 'spring', 'swift', 'spark', 'node', 'rest', 'cloud', 'architecture', 'rails', 'dart',
+]);
+const CONTEXT_WINDOW = 50;
+
+// Checked in order; the first match decides the engagement mode
+const MODE_PATTERNS = [
+  ['Hybrid', /\bhybrid\b/],
+  ['Remote', /\b(?:remote|work from home|wfh)\b/],
+  ['Onsite', /\b(?:on-?site|work from office|wfo)\b/],
+  ['Contract', /\bcontract(?:ual)?\b/],
+  ['Full-time', /\b(?:full[- ]time|permanent)\b/],
+];
+
+const EXPERIENCE_RANGE = /(\d{1,2}(?:\.\d)?)\s*\+?\s*(?:-|–|to)\s*(\d{1,2}(?:\.\d)?)\s*\+?\s*(?:years?|yrs?)/;
+const EXPERIENCE_MIN = /(?:(?:minimum|min\.?|at least)\s*(?:of\s*)?(\d{1,2}(?:\.\d)?)\s*(?:years?|yrs?))|(?:(\d{1,2}(?:\.\d)?)\s*\+\s*(?:years?|yrs?))/;
+
+const BUDGET_RANGE = /([$€£₹]|usd|inr|eur|gbp|rs\.?)?\s*(\d[\d,]*(?:\.\d+)?)\s*(k|lpa|lakhs?|l|m)?\s*(?:-|–|to)\s*([$€£₹]|usd|inr|eur|gbp|rs\.?)?\s*(\d[\d,]*(?:\.\d+)?)\s*(k|lpa|lakhs?|l|m)?(?![a-z])/g;
+const BUDGET_CONTEXT = /(?:budget|salary|ctc|compensation|pay|rate|package)[^.\n]{0,40}$/;
+const TENURE = /(\d{1,3})\s*[- ]?\s*(?:months?|mos?)\b/;
+
+const CURRENCIES = {
+  $: 'USD', usd: 'USD',
+  '₹': 'INR', inr: 'INR', rs: 'INR', 'rs.': 'INR',
+  '€': 'EUR', eur: 'EUR',
+  '£': 'GBP', gbp: 'GBP',
+};
+const MULTIPLIERS = { k: 1e3, l: 1e5, lakh: 1e5, lakhs: 1e5, lpa: 1e5, m: 1e6 };
+
+const isWordChar = (ch) => ch !== undefined && /[a-z0-9]/.test(ch);
+
+// Aho-Corasick automaton over lowercase patterns. `outputs[node]` lists the
+// pattern indices that end at that node, fail outputs included.
+const buildAutomaton = (patterns) => {
+  const children = [new Map()];
+  const fail = [0];
+  const outputs = [[]];
+
+  patterns.forEach(({ text }, index) => {
+    let node = 0;
+    for (const ch of text) {
+      let next = children[node].get(ch);
+      if (next === undefined) {
+        next = children.length;
+        children.push(new Map());
+        fail.push(0);
+        outputs.push([]);
+        children[node].set(ch, next);
+      }
+      node = next;
+    }
+    outputs[node].push(index);
+  });
+
+  const queue = [...children[0].values()];
+  for (let head = 0; head < queue.length; head++) {
+    const node = queue[head];
+    children[node].forEach((child, ch) => {
+      let f = fail[node];
+      while (f !== 0 && !children[f].has(ch)) {
+        f = fail[f];
+      }
+      fail[child] = children[f].get(ch) ?? 0;
+      outputs[child] = outputs[child].concat(outputs[fail[child]]);
+      queue.push(child);
+    });
+  }
+
+  return { children, fail, outputs, patterns };
+};
+
+let automaton = null;
+let automatonBuildMs = null;
+
+const getAutomaton = () => {
+  if (!automaton) {
+    const started = process.hrtime.bigint();
+    const patterns = [];
+    Object.entries(SKILLS).forEach(([name, [aliases, category]]) => {
+      aliases.forEach((alias) => patterns.push({
+        text: alias, kind: 'skill', name, category, ambiguous: AMBIGUOUS_ALIASES.has(alias),
+      }));
+    });
+    Object.entries(KEYWORDS).forEach(([name, aliases]) => {
+      aliases.forEach((alias) => patterns.push({
+        text: alias, kind: 'keyword', name, ambiguous: AMBIGUOUS_ALIASES.has(alias),
+      }));
+    });
+    automaton = buildAutomaton(patterns);
+    automatonBuildMs = Number(process.hrtime.bigint() - started) / 1e6;
+  }
+  return automaton;
+};
+
+// Longest whole-word dictionary matches, without overlaps, in text order.
+// Ambiguous aliases are dropped unless an unambiguous match is close by.
+const matchTerms = (text) => {
+  const { children, fail, outputs, patterns } = getAutomaton();
+  const found = [];
+  let node = 0;
+
+  for (let i = 0; i < text.length; i++) {
+    const ch = text[i];
+    while (node !== 0 && !children[node].has(ch)) {
+      node = fail[node];
+    }
+    node = children[node].get(ch) ?? 0;
+    outputs[node].forEach((index) => {
+      const pattern = patterns[index];
+      const start = i - pattern.text.length + 1;
+      if (!isWordChar(text[start - 1]) && !isWordChar(text[i + 1])) {
+        found.push({ start, end: i + 1, pattern });
+      }
+    });
+  }
+
+  found.sort((a, b) => a.start - b.start || b.end - a.end);
+  const selected = [];
+  let lastEnd = -1;
+  found.forEach((match) => {
+    if (match.start >= lastEnd) {
+      selected.push(match);
+      lastEnd = match.end;
+    }
+  });
+
+  // Matches are in text order, so the nearest unambiguous match on each side
+  // is enough to decide whether an ambiguous one has context
+  const nextAnchorStart = new Array(selected.length);
+  let next = Infinity;
+  for (let i = selected.length - 1; i >= 0; i--) {
+    nextAnchorStart[i] = next;
+    if (!selected[i].pattern.ambiguous) {
+      next = selected[i].start;
+    }
+  }
+  const terms = [];
+  let previousAnchorEnd = -Infinity;
+  selected.forEach(({ start, end, pattern }, i) => {
+    if (!pattern.ambiguous) {
+      previousAnchorEnd = end;
+      terms.push(pattern);
+    } else if (start - previousAnchorEnd <= CONTEXT_WINDOW || nextAnchorStart[i] - end <= CONTEXT_WINDOW) {
+      terms.push(pattern);
+    }
+  });
+  return terms;
+};
+
+const parseAmount = (value, suffix) => Number(value.replace(/,/g, '')) * (MULTIPLIERS[suffix] || 1);
+
+const extractBudget = (text) => {
+  BUDGET_RANGE.lastIndex = 0;
+  let match;
+  while ((match = BUDGET_RANGE.exec(text)) !== null) {
+    const [whole, currencyMin, min, suffixMin, currencyMax, max, suffixMax] = match;
+    const currency = currencyMin || currencyMax;
+    const suffix = suffixMax || suffixMin;
+    const following = text.slice(match.index + whole.length, match.index + whole.length + 8);
+    if (/^\s*(?:years?|yrs?|months?)/.test(following)) {
+      continue;
+    }
+    if (!currency && !suffix && !BUDGET_CONTEXT.test(text.slice(Math.max(0, match.index - 60), match.index))) {
+      continue;
+    }
+    const result = {
+      jd_op_budget_min: parseAmount(min, suffixMin || suffix),
+      jd_op_budget_max: parseAmount(max, suffix),
+    };
+    const code = CURRENCIES[currency] || (['lpa', 'lakh', 'lakhs', 'l'].includes(suffix) ? 'INR' : null);
+    if (code) {
+      result.jd_currency = code;
+    }
+    return result;
+  }
+  return {};
+};
+
+// Extracts form fields from JD text. Only fields that were found are returned,
+// so the result can be merged straight into the JD form. Mode and category are
+// returned by name for the caller to resolve to ids.
+const extract = (input) => {
+  const text = String(input || '').toLowerCase();
+  const result = {};
+
+  const skills = [];
+  const keywords = [];
+  const categoryHits = {};
+  matchTerms(text).forEach(({ kind, name, category }) => {
+    const list = kind === 'skill' ? skills : keywords;
+    if (!list.includes(name)) {
+      list.push(name);
+      if (category) {
+        categoryHits[category] = (categoryHits[category] || 0) + 1;
+      }
+    }
+  });
+  if (skills.length) {
+    result.jd_skillset = skills;
+    result.category_name = Object.entries(categoryHits).sort((a, b) => b[1] - a[1])[0][0];
+  }
+  if (keywords.length) {
+    result.jd_keywords = keywords;
+  }
+
+  const range = text.match(EXPERIENCE_RANGE);
+  if (range) {
+    result.jd_op_exp_min = Number(range[1]);
+    result.jd_op_exp_max = Number(range[2]);
+  } else {
+    const min = text.match(EXPERIENCE_MIN);
+    if (min) {
+      result.jd_op_exp_min = Number(min[1] || min[2]);
+    }
+  }
+
+  Object.assign(result, extractBudget(text));
+
+  const tenure = text.match(TENURE);
+  if (tenure) {
+    result.jd_tenure = Number(tenure[1]);
+  }
+
+  const mode = MODE_PATTERNS.find(([, pattern]) => pattern.test(text));
+  if (mode) {
+    result.mode_name = mode[0];
+  }
+
+  return result;
+};
+
+// Small LRU keyed by the SHA-1 of the text; Map keeps insertion order
+const createLruCache = (maxEntries) => {
+  const entries = new Map();
+  return {
+    get: (key) => {
+      if (!entries.has(key)) {
+        return undefined;
+      }
+      const value = entries.get(key);
+      entries.delete(key);
+      entries.set(key, value);
+      return value;
+    },
+    set: (key, value) => {
+      entries.delete(key);
+      entries.set(key, value);
+      if (entries.size > maxEntries) {
+        entries.delete(entries.keys().next().value);
+      }
+    },
+    size: () => entries.size,
+  };
+};
+
+// Worker threads, started on the first large batch and reused afterwards
+const createWorkerPool = (size) => {
+  const workers = [];
+  let nextJob = 0;
+
+  const start = () => {
+    const entry = { worker: new Worker(path.join(__dirname, 'scanWorker.js')), pending: new Map() };
+    entry.worker.on('message', ({ id, results }) => {
+      entry.pending.get(id).resolve(results);
+      entry.pending.delete(id);
+      if (entry.pending.size === 0) {
+        entry.worker.unref();
+      }
+    });
+    // A failed worker rejects its outstanding jobs and is replaced on the next batch
+    entry.worker.on('error', (error) => {
+      entry.pending.forEach(({ reject }) => reject(error));
+      entry.pending.clear();
+      workers.splice(workers.indexOf(entry), 1);
+    });
+    entry.worker.unref();
+    return entry;
+  };
+
+  const run = (texts) => {
+    while (workers.length < size) {
+      workers.push(start());
+    }
+    const sliceSize = Math.ceil(texts.length / workers.length);
+    const jobs = workers.map(({ worker, pending }, index) => {
+      const slice = texts.slice(index * sliceSize, (index + 1) * sliceSize);
+      if (!slice.length) {
+        return Promise.resolve([]);
+      }
+      const id = nextJob++;
+      return new Promise((resolve, reject) => {
+        pending.set(id, { resolve, reject });
+        // Idle workers are unref'd so they never hold the process open
+        worker.ref();
+        worker.postMessage({ id, texts: slice });
+      });
+    });
+    return Promise.all(jobs).then((parts) => parts.flat());
+  };
+
+  return { run, size: () => workers.length };
+};
+
+const createScanner = ({
+  cacheSize = 1000,
+  poolSize = Math.max(1, os.cpus().length - 1),
+  parallelThreshold = 32,
+} = {}) => {
+  const cache = createLruCache(cacheSize);
+  const pool = createWorkerPool(poolSize);
+  const counters = { hits: 0, misses: 0, scanned: 0 };
+
+  const keyOf = (text) => crypto.createHash('sha1').update(String(text || '')).digest('base64');
+
+  const scan = (text) => {
+    const key = keyOf(text);
+    const cached = cache.get(key);
+    if (cached) {
+      counters.hits += 1;
+      return cached;
+    }
+    counters.misses += 1;
+    counters.scanned += 1;
+    const result = extract(text);
+    cache.set(key, result);
+    return result;
+  };
+
+  // Cached texts are answered directly; the rest go to the worker pool when
+  // there are enough of them to outweigh the message passing
+  const scanBatch = async (texts) => {
+    const keys = texts.map(keyOf);
+    const results = keys.map((key) => cache.get(key));
+    const missing = [];
+    results.forEach((result, index) => {
+      if (result) {
+        counters.hits += 1;
+      } else {
+        counters.misses += 1;
+        missing.push(index);
+      }
+    });
+
+    const missingTexts = missing.map((index) => texts[index]);
+    const scanned = missingTexts.length >= parallelThreshold && poolSize > 1
+      ? await pool.run(missingTexts)
+      : missingTexts.map(extract);
+
+    counters.scanned += scanned.length;
+    missing.forEach((index, i) => {
+      results[index] = scanned[i];
+      cache.set(keys[index], scanned[i]);
+    });
+    return results;
+  };
+
+  return {
+    scan,
+    scanBatch,
+    warmUp: getAutomaton,
+    stats: () => ({
+      ...counters,
+      cached: cache.size(),
+      workers: pool.size(),
+      automaton_build_ms: automatonBuildMs === null ? null : Number(automatonBuildMs.toFixed(3)),
+    }),
+  };
+};
+
+module.exports = { createScanner, extract };
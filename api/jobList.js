@@ -0,0 +1,226 @@
+// Listing helpers for GET /api/jd: keyset cursors over the store's
+// creation-ordered jobs array, the structured filters, aging ranges and field
+// projections. Search reuses the filters; export reads its rows in chunks
+// with the same filters and aging range.
+
+const { agingDays, agingCutoff } = require('./aging');
+
+// List view paging
+const DEFAULT_PAGE_SIZE = 50;
+const MAX_PAGE_SIZE = 500;
+
+// Export rows are read this many at a time
+const EXPORT_CHUNK_SIZE = 1000;
+
+// Long text columns are only returned by the list endpoint when asked for via `fields=`
+const LONG_TEXT_FIELDS = ['jd_original', 'jd_special_instruction', 'jd_source', 'original_jd', 'special_instruction'];
+
+// Query parameter -> column used by the list filters
+const EQUALITY_FILTERS = {
+  status: 'jd_status',
+  mode: 'jd_mode',
+  customer_id: 'jd_customer_id',
+  category_id: 'jd_skillset_cat',
+};
+
+// Cursors are opaque to the client: base64url of the last row's [created_at, id]
+const encodeCursor = (jd) => Buffer.from(JSON.stringify([jd.created_at, jd.id])).toString('base64url');
+
+const decodeCursor = (cursor) => {
+  const key = JSON.parse(Buffer.from(cursor, 'base64url').toString('utf8'));
+  if (!Array.isArray(key) || key.length !== 2) {
+    throw new Error('Malformed cursor');
+  }
+  return key;
+};
+
+// Rows are appended in creation order, so the store is sorted by (created_at, id)
+const compareKey = (jd, [createdAt, id]) => {
+  if (jd.created_at !== createdAt) {
+    return jd.created_at < createdAt ? -1 : 1;
+  }
+  return Number(jd.id) - Number(id);
+};
+
+// Index of the first row in `jobs` whose key is >= `key`
+const seekCursor = (jobs, key) => {
+  let lo = 0;
+  let hi = jobs.length;
+  while (lo < hi) {
+    const mid = (lo + hi) >> 1;
+    if (compareKey(jobs[mid], key) < 0) {
+      lo = mid + 1;
+    } else {
+      hi = mid;
+    }
+  }
+  return lo;
+};
+
+const parseNumber = (value) => (value == null || value === '' ? null : Number(value));
+
+// Numeric query parameters used by the range filters
+const NUMERIC_PARAMS = ['exp_min', 'exp_max', 'budget_min', 'budget_max'];
+
+// Aging bounds are whole days. Anything past a century is refused: the cutoff
+// has to stay a valid date, and outside years 0000-9999 toISOString() would
+// throw or stop sorting as a string.
+const AGING_PARAMS = ['aging_min', 'aging_max'];
+const MAX_AGING_DAYS = 36500;
+
+// Returns a message for the first parameter the filters can't use, or null.
+// Checked before any response is started, so export can still answer 400.
+const validateListQuery = (query) => {
+  const invalid = NUMERIC_PARAMS.find((param) => {
+    const value = parseNumber(query[param]);
+    return value != null && !Number.isFinite(value);
+  });
+  if (invalid) {
+    return `Invalid ${invalid}: must be a number`;
+  }
+  const invalidAging = AGING_PARAMS.find((param) => {
+    const value = parseNumber(query[param]);
+    return value != null && !(Number.isInteger(value) && value >= 0 && value <= MAX_AGING_DAYS);
+  });
+  return invalidAging ? `Invalid ${invalidAging}: must be a whole number of days from 0 to ${MAX_AGING_DAYS}` : null;
+};
+
+const buildListFilter = (query) => {
+  const checks = [];
+
+  Object.entries(EQUALITY_FILTERS).forEach(([param, column]) => {
+    if (query[param] != null && query[param] !== '') {
+      const expected = String(query[param]);
+      checks.push((jd) => String(jd[column]) === expected);
+    }
+  });
+
+  // Range filters keep rows whose whole min/max range sits inside the requested bounds
+  const ranges = [
+    ['exp_min', 'exp_max', 'jd_op_exp_min', 'jd_op_exp_max'],
+    ['budget_min', 'budget_max', 'jd_op_budget_min', 'jd_op_budget_max'],
+  ];
+  ranges.forEach(([minParam, maxParam, minColumn, maxColumn]) => {
+    const min = parseNumber(query[minParam]);
+    const max = parseNumber(query[maxParam]);
+    if (min != null) {
+      checks.push((jd) => Number(jd[minColumn]) >= min);
+    }
+    if (max != null) {
+      checks.push((jd) => Number(jd[maxColumn]) <= max);
+    }
+  });
+
+  // null lets callers skip per-row checks entirely when nothing is filtered
+  if (checks.length === 0) {
+    return null;
+  }
+  return (jd) => checks.every((check) => check(jd));
+};
+
+// Aging bounds become a created_at range, so they narrow the scan instead of
+// filtering it. Rows in [stop, start) of `jobs` are within the bounds.
+const agingRange = (jobs, query, now) => {
+  const agingMin = parseNumber(query.aging_min);
+  const agingMax = parseNumber(query.aging_max);
+  return {
+    start: agingMin != null ? seekCursor(jobs, [agingCutoff(agingMin, now), 0]) : jobs.length,
+    stop: agingMax != null ? seekCursor(jobs, [agingCutoff(agingMax + 1, now), 0]) : 0,
+  };
+};
+
+// jd_aging is derived from created_at on read rather than stored
+const withAging = (jd, now) => ({ ...jd, jd_aging: agingDays(jd.created_at, now) });
+
+const buildProjection = (fields, now) => {
+  if (!fields) {
+    return (jd) => {
+      const row = withAging(jd, now);
+      LONG_TEXT_FIELDS.forEach((field) => delete row[field]);
+      return row;
+    };
+  }
+
+  const selected = ['id', ...String(fields).split(',').map((field) => field.trim()).filter(Boolean)];
+  return (jd) => {
+    const full = withAging(jd, now);
+    const row = {};
+    selected.forEach((field) => {
+      if (field in full) {
+        row[field] = full[field];
+      }
+    });
+    return row;
+  };
+};
+
+const parseLimit = (value) => Math.min(Math.max(parseInt(value, 10) || DEFAULT_PAGE_SIZE, 1), MAX_PAGE_SIZE);
+
+// One page of `jobs`, newest first, from the rows before index `start` (the
+// decoded cursor position). Returns { data, next_cursor }.
+const listPage = (jobs, query, { start = jobs.length, now = new Date() } = {}) => {
+  const limit = parseLimit(query.limit);
+  const range = agingRange(jobs, query, now);
+  const matches = buildListFilter(query) || (() => true);
+  const project = buildProjection(query.fields, now);
+  const page = [];
+  let last = null;
+  let hasMore = false;
+
+  for (let i = Math.min(start, range.start) - 1; i >= range.stop; i--) {
+    const jd = jobs[i];
+    if (!matches(jd)) {
+      continue;
+    }
+    if (page.length === limit) {
+      hasMore = true;
+      break;
+    }
+    page.push(project(jd));
+    last = jd;
+  }
+
+  return { data: page, next_cursor: hasMore ? encodeCursor(last) : null };
+};
+
+// Yields every row matching the list filters and aging range, newest first,
+// in arrays of up to `chunkSize` rows. Each chunk re-seeks from the last
+// scanned row's key, like the list cursor, so writes that land while the
+// export is streaming cannot shift rows under it.
+function* exportChunks(jobs, query, { now = new Date(), chunkSize = EXPORT_CHUNK_SIZE } = {}) {
+  const matches = buildListFilter(query) || (() => true);
+  let { start, stop } = agingRange(jobs, query, now);
+  while (start > stop) {
+    const chunk = [];
+    let i = start - 1;
+    for (; i >= stop && chunk.length < chunkSize; i--) {
+      if (matches(jobs[i])) {
+        chunk.push(jobs[i]);
+      }
+    }
+    const done = i < stop;
+    const last = jobs[i + 1];
+    if (chunk.length) {
+      yield chunk;
+    }
+    if (done) {
+      return;
+    }
+    ({ start, stop } = agingRange(jobs, query, now));
+    start = Math.min(start, seekCursor(jobs, [last.created_at, last.id]));
+  }
+}
+
+module.exports = {
+  encodeCursor,
+  decodeCursor,
+  seekCursor,
+  validateListQuery,
+  buildListFilter,
+  agingRange,
+  withAging,
+  buildProjection,
+  parseLimit,
+  listPage,
+  exportChunks,
+};
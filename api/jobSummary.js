@@ -0,0 +1,165 @@
+// Running job summary counters for the dashboard.
+//
+// Keeps the figures from the v_job_summary and v_customer_job_summary views up
+// to date from store change events instead of aggregating every row on read.
+// reconcile() recomputes them from scratch and reports any drift.
+
+// Numeric columns summed/averaged by the views. Like SQL SUM/AVG, rows with a
+// missing value are skipped and an empty set gives null.
+const MEASURES = {
+  open_positions: (jd) => jd.jd_open_position,
+  // jd_available_pos is a VARCHAR; CAST(... AS UNSIGNED) keeps the leading
+  // integer and turns text without one into 0. NULL stays NULL.
+  available_positions: (jd) => (jd.jd_available_pos == null ? null : parseInt(jd.jd_available_pos, 10) || 0),
+  tenure: (jd) => jd.jd_tenure,
+  budget_min: (jd) => jd.jd_op_budget_min,
+  budget_max: (jd) => jd.jd_op_budget_max,
+};
+
+// [read, sum key, count key] per measure, so rows don't rebuild the key names
+const MEASURE_FIELDS = Object.entries(MEASURES).map(([name, read]) => [read, `${name}_sum`, `${name}_n`]);
+
+const emptyTotals = () => ({
+  total: 0,
+  active: 0,
+  open: 0,
+  closed: 0,
+  ...Object.fromEntries(Object.keys(MEASURES).flatMap((name) => [[`${name}_sum`, 0], [`${name}_n`, 0]])),
+});
+
+const isActive = (jd) => jd.jd_active !== false && jd.jd_active !== 0;
+
+const addRow = (totals, jd, sign) => {
+  totals.total += sign;
+  totals.active += isActive(jd) ? sign : 0;
+  totals.open += jd.jd_status === 'Open' ? sign : 0;
+  totals.closed += jd.jd_status === 'Closed' ? sign : 0;
+  MEASURE_FIELDS.forEach(([read, sumKey, countKey]) => {
+    const raw = read(jd);
+    const value = raw == null || raw === '' ? NaN : Number(raw);
+    if (!Number.isNaN(value)) {
+      totals[sumKey] += sign * value;
+      totals[countKey] += sign;
+    }
+  });
+};
+
+const sumOf = (totals, name) => (totals[`${name}_n`] ? totals[`${name}_sum`] : null);
+const avgOf = (totals, name) => (totals[`${name}_n`] ? Number((totals[`${name}_sum`] / totals[`${name}_n`]).toFixed(4)) : null);
+
+const createJobSummary = (store) => {
+  let overall = emptyTotals();
+  let byCustomer = new Map();
+  let lastReconcile = null;
+
+  const customerTotals = (customerId) => {
+    const key = Number(customerId);
+    if (!byCustomer.has(key)) {
+      byCustomer.set(key, emptyTotals());
+    }
+    return byCustomer.get(key);
+  };
+
+  const apply = (jd, sign) => {
+    addRow(overall, jd, sign);
+    if (jd.jd_customer_id != null) {
+      addRow(customerTotals(jd.jd_customer_id), jd, sign);
+    }
+  };
+
+  store.onChange((table, change) => {
+    if (table !== 'job_descriptions') {
+      return;
+    }
+    if (change.previous) {
+      apply(change.previous, -1);
+    }
+    if (change.row) {
+      apply(change.row, 1);
+    }
+  });
+
+  // Same columns as v_job_summary, plus the sum and average of every measure
+  const jobSummary = () => ({
+    total_jobs: overall.total,
+    active_jobs: overall.active,
+    open_jobs: overall.open,
+    closed_jobs: overall.closed,
+    total_open_positions: sumOf(overall, 'open_positions'),
+    total_available_positions: sumOf(overall, 'available_positions'),
+    total_tenure_months: sumOf(overall, 'tenure'),
+    total_budget_min: sumOf(overall, 'budget_min'),
+    total_budget_max: sumOf(overall, 'budget_max'),
+    avg_open_positions: avgOf(overall, 'open_positions'),
+    avg_available_positions: avgOf(overall, 'available_positions'),
+    avg_tenure_months: avgOf(overall, 'tenure'),
+    avg_budget_min: avgOf(overall, 'budget_min'),
+    avg_budget_max: avgOf(overall, 'budget_max'),
+  });
+
+  // Same columns as v_customer_job_summary, plus the sum and average of every
+  // measure; customers without jobs are included
+  const customerSummary = () => store.listTable('customers').map((customer) => {
+    const totals = byCustomer.get(customer.customer_id) || emptyTotals();
+    return {
+      customer_id: customer.customer_id,
+      customer_name: customer.customer_name,
+      total_jobs: totals.total,
+      active_jobs: totals.active,
+      total_positions: sumOf(totals, 'open_positions'),
+      total_available_positions: sumOf(totals, 'available_positions'),
+      total_tenure_months: sumOf(totals, 'tenure'),
+      total_budget_min: sumOf(totals, 'budget_min'),
+      total_budget_max: sumOf(totals, 'budget_max'),
+      avg_open_positions: avgOf(totals, 'open_positions'),
+      avg_available_positions: avgOf(totals, 'available_positions'),
+      avg_tenure_months: avgOf(totals, 'tenure'),
+      avg_budget_min: avgOf(totals, 'budget_min'),
+      avg_budget_max: avgOf(totals, 'budget_max'),
+    };
+  });
+
+  // Rebuilds the counters from the store and returns the fields that differed
+  const reconcile = () => {
+    const freshOverall = emptyTotals();
+    const freshByCustomer = new Map();
+    store.jobs.forEach((jd) => {
+      addRow(freshOverall, jd, 1);
+      if (jd.jd_customer_id != null) {
+        const key = Number(jd.jd_customer_id);
+        if (!freshByCustomer.has(key)) {
+          freshByCustomer.set(key, emptyTotals());
+        }
+        addRow(freshByCustomer.get(key), jd, 1);
+      }
+    });
+
+    const drift = [];
+    const compare = (scope, expected, actual) => {
+      Object.keys(expected).forEach((field) => {
+        // Relative tolerance absorbs float error from adding and removing budgets
+        if (Math.abs(expected[field] - actual[field]) > 1e-9 * Math.max(1, Math.abs(expected[field]))) {
+          drift.push({ scope, field, expected: expected[field], actual: actual[field] });
+        }
+      });
+    };
+    compare('overall', freshOverall, overall);
+    new Set([...freshByCustomer.keys(), ...byCustomer.keys()]).forEach((key) => {
+      compare(`customer:${key}`, freshByCustomer.get(key) || emptyTotals(), byCustomer.get(key) || emptyTotals());
+    });
+
+    overall = freshOverall;
+    byCustomer = freshByCustomer;
+    lastReconcile = { at: new Date().toISOString(), drift: drift.length };
+    return drift;
+  };
+
+  return {
+    jobSummary,
+    customerSummary,
+    reconcile,
+    stats: () => ({ customers: byCustomer.size, last_reconcile: lastReconcile }),
+  };
+};
+
+module.exports = { createJobSummary };
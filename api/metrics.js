@@ -0,0 +1,237 @@
+// Request instrumentation for the mock API, exposed at /metrics in the
+// Prometheus text format.
+//
+// For every request we record latency, how many store queries it made and how
+// long they took (so N+1 patterns stand out), JSON serialization time and
+// response size, all labelled by route. Requests can also be CPU profiled:
+// set PROFILE_DIR, then send `X-Profile: 1` or set PROFILE_SAMPLE_RATE.
+
+const fs = require('fs');
+const inspector = require('inspector');
+const path = require('path');
+const { AsyncLocalStorage } = require('async_hooks');
+
+const LATENCY_BUCKETS = [0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5];
+const QUERY_COUNT_BUCKETS = [0, 1, 2, 5, 10, 25, 50, 100];
+const SIZE_BUCKETS = [256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304];
+
+const escapeLabel = (value) => String(value).replace(/\\/g, '\\\\').replace(/"/g, '\\"').replace(/\n/g, '\\n');
+
+const formatLabels = (labels) => {
+  const pairs = Object.entries(labels).map(([key, value]) => `${key}="${escapeLabel(value)}"`);
+  return pairs.length ? `{${pairs.join(',')}}` : '';
+};
+
+const createCounter = (name, help) => {
+  const series = new Map();
+  return {
+    inc: (labels, value = 1) => {
+      const key = formatLabels(labels);
+      series.set(key, (series.get(key) || 0) + value);
+    },
+    // Incrementer for a fixed label set, formatted once for hot paths
+    bind: (labels) => {
+      const key = formatLabels(labels);
+      series.set(key, series.get(key) || 0);
+      return (value = 1) => {
+        series.set(key, series.get(key) + value);
+      };
+    },
+    render: () => [
+      `# HELP ${name} ${help}`,
+      `# TYPE ${name} counter`,
+      ...[...series].map(([labels, value]) => `${name}${labels} ${value}`),
+    ],
+  };
+};
+
+const createHistogram = (name, help, buckets) => {
+  const series = new Map();
+  return {
+    observe: (labels, value) => {
+      const key = JSON.stringify(labels);
+      let entry = series.get(key);
+      if (!entry) {
+        entry = { labels, counts: new Array(buckets.length).fill(0), sum: 0, count: 0 };
+        series.set(key, entry);
+      }
+      const index = buckets.findIndex((bound) => value <= bound);
+      if (index !== -1) {
+        entry.counts[index] += 1;
+      }
+      entry.sum += value;
+      entry.count += 1;
+    },
+    render: () => {
+      const lines = [`# HELP ${name} ${help}`, `# TYPE ${name} histogram`];
+      series.forEach(({ labels, counts, sum, count }) => {
+        let cumulative = 0;
+        buckets.forEach((bound, i) => {
+          cumulative += counts[i];
+          lines.push(`${name}_bucket${formatLabels({ ...labels, le: bound })} ${cumulative}`);
+        });
+        lines.push(`${name}_bucket${formatLabels({ ...labels, le: '+Inf' })} ${count}`);
+        lines.push(`${name}_sum${formatLabels(labels)} ${sum}`);
+        lines.push(`${name}_count${formatLabels(labels)} ${count}`);
+      });
+      return lines;
+    },
+  };
+};
+
+const elapsedSeconds = (started) => Number(process.hrtime.bigint() - started) / 1e9;
+
+const createMetrics = ({
+  profileDir = process.env.PROFILE_DIR,
+  profileSampleRate = Number(process.env.PROFILE_SAMPLE_RATE) || 0,
+} = {}) => {
+  const requestContext = new AsyncLocalStorage();
+  const contexts = new WeakMap();
+
+  const requests = createCounter('rectool_http_requests_total', 'HTTP requests by route and status');
+  const duration = createHistogram('rectool_http_request_duration_seconds', 'Request latency', LATENCY_BUCKETS);
+  const queryCount = createHistogram('rectool_http_request_store_queries', 'Store queries made per request', QUERY_COUNT_BUCKETS);
+  const queryTime = createHistogram('rectool_http_request_store_seconds', 'Time spent in store queries per request', LATENCY_BUCKETS);
+  const serializeTime = createHistogram('rectool_http_response_serialize_seconds', 'JSON serialization time per response', LATENCY_BUCKETS);
+  const responseSize = createHistogram('rectool_http_response_size_bytes', 'Response body size', SIZE_BUCKETS);
+  const storeQueries = createCounter('rectool_store_queries_total', 'Store queries by operation');
+  const storeSeconds = createCounter('rectool_store_query_seconds_total', 'Time spent in store queries by operation');
+
+  // Only one CPU profile can run at a time
+  let profiling = false;
+
+  const startProfile = (req, res) => {
+    profiling = true;
+    const session = new inspector.Session();
+    session.connect();
+    const file = path.join(profileDir, `${Date.now()}-${req.method}-${req.path.replace(/[^a-z0-9]+/gi, '_')}.cpuprofile`);
+    res.set('X-Profile', path.basename(file));
+    session.post('Profiler.enable', () => session.post('Profiler.start'));
+    return () => {
+      session.post('Profiler.stop', (error, result) => {
+        session.disconnect();
+        profiling = false;
+        if (!error) {
+          fs.mkdir(profileDir, { recursive: true }, () => {
+            fs.writeFile(file, JSON.stringify(result.profile), () => {});
+          });
+        }
+      });
+    };
+  };
+
+  const middleware = (req, res, next) => {
+    const started = process.hrtime.bigint();
+    const context = { queries: 0, querySeconds: 0, serializeSeconds: 0, bytes: 0 };
+    contexts.set(req, context);
+
+    // Time serialization separately from the rest of the handler
+    res.json = (body) => {
+      const serializeStarted = process.hrtime.bigint();
+      const text = JSON.stringify(body);
+      context.serializeSeconds += elapsedSeconds(serializeStarted);
+      if (!res.get('Content-Type')) {
+        res.type('application/json');
+      }
+      return res.send(text);
+    };
+
+    const write = res.write;
+    const end = res.end;
+    res.write = function countedWrite(chunk, ...args) {
+      if (chunk) {
+        context.bytes += typeof chunk === 'string' ? Buffer.byteLength(chunk) : chunk.length;
+      }
+      return write.call(this, chunk, ...args);
+    };
+    res.end = function countedEnd(chunk, ...args) {
+      if (chunk && typeof chunk !== 'function') {
+        context.bytes += typeof chunk === 'string' ? Buffer.byteLength(chunk) : chunk.length;
+      }
+      return end.call(this, chunk, ...args);
+    };
+
+    const wantsProfile = profileDir && !profiling
+      && (req.get('X-Profile') === '1' || Math.random() < profileSampleRate);
+    const stopProfile = wantsProfile ? startProfile(req, res) : null;
+
+    // 'finish' only fires for completed responses; 'close' also covers clients
+    // that disconnect and responses that are destroyed mid-stream
+    let recorded = false;
+    const record = () => {
+      if (recorded) {
+        return;
+      }
+      recorded = true;
+      const route = req.route ? `${req.baseUrl}${req.route.path}` : 'unmatched';
+      const labels = { method: req.method, route };
+      requests.inc({ ...labels, status: res.writableFinished ? res.statusCode : 'aborted' });
+      duration.observe(labels, elapsedSeconds(started));
+      queryCount.observe(labels, context.queries);
+      queryTime.observe(labels, context.querySeconds);
+      serializeTime.observe(labels, context.serializeSeconds);
+      responseSize.observe(labels, context.bytes);
+      if (stopProfile) {
+        stopProfile();
+      }
+    };
+    res.on('finish', record);
+    res.on('close', record);
+
+    requestContext.run(context, next);
+  };
+
+  // Body parsers call next() from stream events, which run outside the
+  // request's async context; mount this after them to get it back
+  const restoreContext = (req, res, next) => {
+    const context = contexts.get(req);
+    return context ? requestContext.run(context, next) : next();
+  };
+
+  // Per-operation counters, bound on first use
+  const operations = new Map();
+
+  // Store hook: attributes each query to the request it ran in, if any
+  const onQuery = (operation, ms) => {
+    let counters = operations.get(operation);
+    if (!counters) {
+      counters = { queries: storeQueries.bind({ operation }), seconds: storeSeconds.bind({ operation }) };
+      operations.set(operation, counters);
+    }
+    counters.queries();
+    counters.seconds(ms / 1000);
+    const context = requestContext.getStore();
+    if (context) {
+      context.queries += 1;
+      context.querySeconds += ms / 1000;
+    }
+  };
+
+  const render = (extra = []) => {
+    const memory = process.memoryUsage();
+    return [
+      ...requests.render(),
+      ...duration.render(),
+      ...queryCount.render(),
+      ...queryTime.render(),
+      ...serializeTime.render(),
+      ...responseSize.render(),
+      ...storeQueries.render(),
+      ...storeSeconds.render(),
+      '# HELP process_resident_memory_bytes Resident memory size',
+      '# TYPE process_resident_memory_bytes gauge',
+      `process_resident_memory_bytes ${memory.rss}`,
+      '# HELP nodejs_heap_used_bytes V8 heap in use',
+      '# TYPE nodejs_heap_used_bytes gauge',
+      `nodejs_heap_used_bytes ${memory.heapUsed}`,
+      '# HELP process_uptime_seconds Process uptime',
+      '# TYPE process_uptime_seconds gauge',
+      `process_uptime_seconds ${process.uptime()}`,
+      ...extra,
+    ].join('\n') + '\n';
+  };
+
+  return { middleware, restoreContext, onQuery, render };
+};
+
+module.exports = { createMetrics };
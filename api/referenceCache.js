@@ -0,0 +1,101 @@
+// Cache for the reference data endpoints.
+//
+// Each resource is serialized once into a JSON buffer with a strong ETag, then
+// served from memory until its TTL expires or a write to one of its source
+// tables invalidates it.
+
+const crypto = require('crypto');
+
+// Resource name -> source table and the columns exposed to the client
+const RESOURCES = {
+  categories: { table: 'skillset_categories', columns: ['category_id', 'category_name', 'description'] },
+  modes: { table: 'engagement_modes', columns: ['mode_id', 'mode_name', 'description'] },
+  statuses: { table: 'job_statuses', columns: ['status_id', 'status_name'] },
+  users: { table: 'users', columns: ['user_id', 'username', 'full_name', 'role'] },
+  currencies: { table: 'currencies', columns: ['currency_code', 'currency_name'] },
+};
+
+// The combined bundle is cached like any other resource
+const BUNDLE = 'reference';
+
+const pick = (row, columns) => Object.fromEntries(columns.map((column) => [column, row[column]]));
+
+const createReferenceCache = (store, { ttlMs = 5 * 60 * 1000 } = {}) => {
+  const entries = new Map();
+  const counters = { hits: 0, misses: 0, invalidations: 0 };
+  let version = 0;
+
+  const loadRows = (name) => {
+    const { table, columns } = RESOURCES[name];
+    return store.listTable(table)
+      .filter((row) => row.is_active !== false)
+      .map((row) => pick(row, columns));
+  };
+
+  const build = (name) => {
+    const data = name === BUNDLE
+      ? Object.fromEntries(Object.keys(RESOURCES).map((resource) => [resource, loadRows(resource)]))
+      : loadRows(name);
+    const body = Buffer.from(JSON.stringify({ success: true, data }));
+    const etag = `"${crypto.createHash('sha1').update(body).digest('base64url')}"`;
+    return { body, etag, expiresAt: Date.now() + ttlMs };
+  };
+
+  const get = (name) => {
+    const cached = entries.get(name);
+    if (cached && cached.expiresAt > Date.now()) {
+      counters.hits += 1;
+      return cached;
+    }
+    counters.misses += 1;
+    const entry = build(name);
+    entries.set(name, entry);
+    return entry;
+  };
+
+  const invalidate = (name) => {
+    entries.delete(name);
+    entries.delete(BUNDLE);
+    counters.invalidations += 1;
+    version += 1;
+  };
+
+  store.onChange((table) => {
+    Object.entries(RESOURCES)
+      .filter(([, resource]) => resource.table === table)
+      .forEach(([name]) => invalidate(name));
+  });
+
+  // Express handler; answers conditional requests with 304 Not Modified
+  const handler = (name) => (req, res) => {
+    try {
+      const entry = get(name);
+      res.set({
+        ETag: entry.etag,
+        'Cache-Control': 'no-cache',
+      });
+
+      const ifNoneMatch = req.get('If-None-Match');
+      if (ifNoneMatch && ifNoneMatch.split(',').some((tag) => tag.trim() === entry.etag)) {
+        return res.status(304).end();
+      }
+
+      res.type('application/json').send(entry.body);
+    } catch (error) {
+      res.status(500).json({
+        success: false,
+        message: `Failed to load ${name}`,
+        error: error.message
+      });
+    }
+  };
+
+  return {
+    resources: Object.keys(RESOURCES),
+    bundle: BUNDLE,
+    handler,
+    stats: () => ({ ...counters, version, cached: entries.size }),
+  };
+};
+
+module.exports = { createReferenceCache };
@@ -0,0 +1,7 @@
+// Worker thread for batch JD scans; see createWorkerPool in jdScanner.js
+const { parentPort } = require('worker_threads');
+const { extract } = require('./jdScanner');
+
+parentPort.on('message', ({ id, texts }) => {
+  parentPort.postMessage({ id, results: texts.map(extract) });
+});
@@ -0,0 +1,678 @@
+// Inverted index over job description text for GET /api/jd/search.
+//
+// Covers the title, original JD text, skills and keywords. Each term maps to a
+// posting list held in typed arrays (doc ids in ascending order and weighted
+// term frequencies), and results are ranked with BM25. The last query token
+// also matches as a prefix so results update while the user is still typing.
+//
+// Queries are scored document at a time with MaxScore pruning: once the top
+// results are known well enough, docs that can't reach them are skipped
+// without reading the rest of their postings.
+
+// Field weights applied to term frequencies (a simple BM25F)
+const FIELDS = {
+  jd_title: 3,
+  jd_skillset: 2,
+  jd_keywords: 2,
+  jd_original: 1,
+};
+
+const K1 = 1.2;
+const B = 0.75;
+
+// Queries over more terms than this (short prefixes expand to many) score
+// every posting instead; picking the next doc costs a pass over the lists
+const MAX_PRUNED_TERMS = 16;
+
+const tokenize = (text) => {
+  if (!text) {
+    return [];
+  }
+  const normalized = String(text)
+    .normalize('NFKD')
+    .replace(/[\u0300-\u036f]/g, '')
+    .toLowerCase();
+  // Keep +, # and inner dots so c++, c# and node.js survive as single tokens
+  return (normalized.match(/[a-z0-9][a-z0-9+#.]*/g) || []).map((token) => token.replace(/\.+$/, ''));
+};
+
+const fieldText = (value) => {
+  if (Array.isArray(value)) {
+    return value.join(' ');
+  }
+  if (typeof value === 'string' && value.startsWith('[')) {
+    try {
+      const parsed = JSON.parse(value);
+      return Array.isArray(parsed) ? parsed.join(' ') : value;
+    } catch {
+      return value;
+    }
+  }
+  return value;
+};
+
+// Postings are grouped in blocks of 128 for block-max bounds
+const BLOCK_SHIFT = 7;
+
+// Growable posting list of (doc id, weighted tf) pairs, sorted by id. Ids
+// are auto-increment keys, so new docs append; only an updated doc, which is
+// removed and added again under the same id, has to be slotted back in.
+//
+// maxFreq and minLength bound the BM25 score of any posting in the list, and
+// blockMaxFreq/blockMinLength the same per block. Appends keep them current;
+// an insert or removal shifts the postings after it, so blocks from there on
+// are rebuilt before the next search (dirtyFrom).
+class PostingList {
+  constructor() {
+    this.ids = new Int32Array(4);
+    this.freqs = new Float32Array(4);
+    this.length = 0;
+    this.maxFreq = 0;
+    this.minLength = Infinity;
+    this.blockMaxFreq = new Float32Array(1);
+    this.blockMinLength = new Float32Array(1);
+    this.dirtyFrom = Infinity;
+  }
+
+  // Position of the first posting with an id >= `id`
+  find(id) {
+    let lo = 0;
+    let hi = this.length;
+    while (lo < hi) {
+      const mid = (lo + hi) >> 1;
+      if (this.ids[mid] < id) {
+        lo = mid + 1;
+      } else {
+        hi = mid;
+      }
+    }
+    return lo;
+  }
+
+  add(id, freq, docLength) {
+    if (this.length === this.ids.length) {
+      const grow = (Type, old, size) => {
+        const next = new Type(size);
+        next.set(old);
+        return next;
+      };
+      this.ids = grow(Int32Array, this.ids, this.length * 2);
+      this.freqs = grow(Float32Array, this.freqs, this.length * 2);
+      const blocks = ((this.length * 2 - 1) >> BLOCK_SHIFT) + 1;
+      this.blockMaxFreq = grow(Float32Array, this.blockMaxFreq, blocks);
+      this.blockMinLength = grow(Float32Array, this.blockMinLength, blocks);
+    }
+    let index = this.length;
+    if (index > 0 && this.ids[index - 1] > id) {
+      index = this.find(id);
+      this.ids.copyWithin(index + 1, index, this.length);
+      this.freqs.copyWithin(index + 1, index, this.length);
+      this.dirtyFrom = Math.min(this.dirtyFrom, index >> BLOCK_SHIFT);
+    }
+    this.ids[index] = id;
+    this.freqs[index] = freq;
+    this.length += 1;
+    this.maxFreq = Math.max(this.maxFreq, freq);
+    this.minLength = Math.min(this.minLength, docLength);
+
+    if (index === this.length - 1) {
+      const block = index >> BLOCK_SHIFT;
+      const first = (index & ((1 << BLOCK_SHIFT) - 1)) === 0;
+      this.blockMaxFreq[block] = first ? freq : Math.max(this.blockMaxFreq[block], freq);
+      this.blockMinLength[block] = first ? docLength : Math.min(this.blockMinLength[block], docLength);
+    }
+  }
+
+  remove(id) {
+    const index = this.find(id);
+    if (index === this.length || this.ids[index] !== id) {
+      return;
+    }
+    this.ids.copyWithin(index, index + 1, this.length);
+    this.freqs.copyWithin(index, index + 1, this.length);
+    this.length -= 1;
+    this.dirtyFrom = Math.min(this.dirtyFrom, index >> BLOCK_SHIFT);
+  }
+
+  // Recomputes the block bounds that shifted, using the indexed doc lengths.
+  // The list-wide bounds are only ever loosened by removals, so they stay.
+  refreshBlocks(lengths) {
+    if (this.dirtyFrom === Infinity) {
+      return;
+    }
+    const blocks = this.length === 0 ? 0 : ((this.length - 1) >> BLOCK_SHIFT) + 1;
+    for (let block = this.dirtyFrom; block < blocks; block++) {
+      const start = block << BLOCK_SHIFT;
+      const end = Math.min(this.length, start + (1 << BLOCK_SHIFT));
+      let maxFreq = 0;
+      let minLength = Infinity;
+      for (let i = start; i < end; i++) {
+        maxFreq = Math.max(maxFreq, this.freqs[i]);
+        minLength = Math.min(minLength, lengths[this.ids[i]]);
+      }
+      this.blockMaxFreq[block] = maxFreq;
+      this.blockMinLength[block] = minLength;
+    }
+    this.dirtyFrom = Infinity;
+  }
+}
+
+// Ranking order: higher score first, ties go to the newer (higher) id
+const ranksAbove = (scores, a, b) => scores[a] > scores[b] || (scores[a] === scores[b] && a > b);
+
+// Min-heap helpers over doc ids: the root is the weakest kept result
+const heapDown = (heap, size, index, scores) => {
+  for (;;) {
+    const left = 2 * index + 1;
+    const right = left + 1;
+    let weakest = index;
+    if (left < size && ranksAbove(scores, heap[weakest], heap[left])) {
+      weakest = left;
+    }
+    if (right < size && ranksAbove(scores, heap[weakest], heap[right])) {
+      weakest = right;
+    }
+    if (weakest === index) {
+      return;
+    }
+    const id = heap[index];
+    heap[index] = heap[weakest];
+    heap[weakest] = id;
+    index = weakest;
+  }
+};
+
+const heapUp = (heap, index, scores) => {
+  while (index > 0) {
+    const parent = (index - 1) >> 1;
+    if (!ranksAbove(scores, heap[parent], heap[index])) {
+      return;
+    }
+    const id = heap[index];
+    heap[index] = heap[parent];
+    heap[parent] = id;
+    index = parent;
+  }
+};
+
+// Best `limit` of the first `count` candidate ids, best first. They are kept
+// in a bounded min-heap, so only the heap is sorted, never the candidate list.
+const topK = (candidates, count, scores, limit) => {
+  const heap = new Int32Array(Math.min(limit, count));
+  if (heap.length === 0) {
+    return [];
+  }
+  let size = 0;
+  // Score of the weakest kept result once the heap is full; most candidates
+  // fall below it and are skipped with a single comparison
+  let floor = -Infinity;
+  // Candidates are mostly in ascending id order; walking them backwards means
+  // equal scores (ties go to the higher id) don't keep displacing the root
+  for (let i = count - 1; i >= 0; i--) {
+    const id = candidates[i];
+    if (size < heap.length) {
+      heap[size] = id;
+      heapUp(heap, size++, scores);
+      if (size === heap.length) {
+        floor = scores[heap[0]];
+      }
+    } else if (scores[id] >= floor && ranksAbove(scores, id, heap[0])) {
+      heap[0] = id;
+      heapDown(heap, size, 0, scores);
+      floor = scores[heap[0]];
+    }
+  }
+  return Array.from(heap).sort((a, b) => (ranksAbove(scores, a, b) ? -1 : 1));
+};
+
+// Best `limit` candidates that pass `accept(id)`. Takes a few times `limit`
+// from topK and widens the window until enough pass, so a filter that matches
+// a fair share of rows is only run on a few hundred of them.
+const topKMatching = (candidates, count, scores, limit, accept) => {
+  const checked = new Map();
+  for (let window = limit * 4; ; window *= 4) {
+    const ranked = topK(candidates, count, scores, window);
+    const results = [];
+    for (const id of ranked) {
+      let ok = checked.get(id);
+      if (ok === undefined) {
+        ok = accept(id);
+        checked.set(id, ok);
+      }
+      if (ok) {
+        results.push(id);
+        if (results.length === limit) {
+          return results;
+        }
+      }
+    }
+    if (ranked.length === count) {
+      return results;
+    }
+  }
+};
+
+const createSearchIndex = () => {
+  const postings = new Map();
+  // Doc id -> { length, terms, row } so removals know which posting lists to
+  // touch and filters can check the row without going back to the store
+  const docs = new Map();
+  let totalLength = 0;
+
+  // Per-id scratch space for scoring, indexed by doc id (ids are dense
+  // auto-increment keys). Zero means unscored; both paths reset the scores
+  // they wrote before returning.
+  let lengths = new Float32Array(1024);
+  let scores = new Float64Array(1024);
+  let touched = new Int32Array(1024);
+
+  const ensureCapacity = (id) => {
+    if (id < lengths.length) {
+      return;
+    }
+    let size = lengths.length;
+    while (size <= id) {
+      size *= 2;
+    }
+    const grow = (Type, old) => {
+      const next = new Type(size);
+      next.set(old);
+      return next;
+    };
+    lengths = grow(Float32Array, lengths);
+    scores = grow(Float64Array, scores);
+  };
+
+  // Sorted vocabulary for prefix lookups, rebuilt lazily after new terms appear
+  let vocabulary = [];
+  let vocabularyDirty = false;
+
+  const add = (jd) => {
+    const counts = new Map();
+    let length = 0;
+    Object.entries(FIELDS).forEach(([field, weight]) => {
+      tokenize(fieldText(jd[field])).forEach((token) => {
+        counts.set(token, (counts.get(token) || 0) + weight);
+        length += weight;
+      });
+    });
+
+    const id = Number(jd.id);
+    counts.forEach((freq, term) => {
+      let list = postings.get(term);
+      if (!list) {
+        list = new PostingList();
+        postings.set(term, list);
+        vocabularyDirty = true;
+      }
+      list.add(id, freq, length);
+    });
+    ensureCapacity(id);
+    lengths[id] = length;
+    docs.set(id, { length, terms: [...counts.keys()], row: jd });
+    totalLength += length;
+  };
+
+  const remove = (jd) => {
+    const id = Number(jd.id);
+    const doc = docs.get(id);
+    if (!doc) {
+      return;
+    }
+    doc.terms.forEach((term) => {
+      const list = postings.get(term);
+      list.remove(id);
+      if (list.length === 0) {
+        postings.delete(term);
+        vocabularyDirty = true;
+      }
+    });
+    docs.delete(id);
+    totalLength -= doc.length;
+  };
+
+  // Keeps the index in step with store change events
+  const apply = (change) => {
+    if (change.previous) {
+      remove(change.previous);
+    }
+    if (change.row) {
+      add(change.row);
+    }
+  };
+
+  const expandPrefix = (prefix) => {
+    if (vocabularyDirty) {
+      vocabulary = [...postings.keys()].sort();
+      vocabularyDirty = false;
+    }
+    let lo = 0;
+    let hi = vocabulary.length;
+    while (lo < hi) {
+      const mid = (lo + hi) >> 1;
+      if (vocabulary[mid] < prefix) {
+        lo = mid + 1;
+      } else {
+        hi = mid;
+      }
+    }
+    const terms = [];
+    for (let i = lo; i < vocabulary.length && vocabulary[i].startsWith(prefix); i++) {
+      terms.push(vocabulary[i]);
+    }
+    return terms;
+  };
+
+  // Scores every posting of every list, then keeps the best. Used when a
+  // query has too many terms for pruning to pay off.
+  const searchExhaustive = (lists, idfs, limit, accept) => {
+    const maxCandidates = lists.reduce((sum, list) => sum + list.length, 0);
+    if (touched.length < maxCandidates) {
+      touched = new Int32Array(maxCandidates);
+    }
+
+    // Hot loop: locals only, and the BM25 length norm folded into two constants.
+    // A zero score marks a doc not seen yet in this search. The longest list
+    // goes first and can't repeat a doc, so it skips that check.
+    const order = lists.map((list, n) => n).sort((a, b) => lists[b].length - lists[a].length);
+    const candidates = touched;
+    const scoreOf = scores;
+    const lengthOf = lengths;
+    const normBase = K1 * (1 - B);
+    const normPerLength = (K1 * B) / (totalLength / docs.size);
+    let count = 0;
+    order.forEach((n, rank) => {
+      const idf = idfs[n];
+      const { ids, freqs, length } = lists[n];
+      for (let i = 0; i < length; i++) {
+        const id = ids[i];
+        const freq = freqs[i];
+        const score = scoreOf[id];
+        if (rank > 0 && score !== 0) {
+          scoreOf[id] = score + idf * ((freq * (K1 + 1)) / (freq + normBase + normPerLength * lengthOf[id]));
+        } else {
+          candidates[count++] = id;
+          scoreOf[id] = idf * ((freq * (K1 + 1)) / (freq + normBase + normPerLength * lengthOf[id]));
+        }
+      }
+    });
+
+    const ranked = accept
+      ? topKMatching(candidates, count, scoreOf, limit, accept)
+      : topK(candidates, count, scoreOf, limit);
+    const results = ranked.map((id) => ({ id, score: scoreOf[id] }));
+
+    // Reset the scratch space for the next search
+    for (let i = 0; i < count; i++) {
+      scoreOf[candidates[i]] = 0;
+    }
+    return results;
+  };
+
+  // Document-at-a-time MaxScore. Lists are ordered by their score bound, and
+  // once the kept results' weakest score (the threshold) exceeds the summed
+  // bounds of the first few lists, those lists become non-essential: a doc
+  // found only in them can't make the cut, so candidates come from the other
+  // lists alone, and a candidate stops being scored as soon as its score plus
+  // the bounds still unread falls short. Block bounds go further: when the
+  // blocks under the essential cursors can't reach the threshold either, every
+  // doc down to the highest block start is skipped unread. Ids are walked from
+  // high to low, so a later doc that only ties the threshold loses (ties go to
+  // the newer id) and can be skipped as well. `accept` only runs on docs that
+  // would be kept.
+  const searchPruned = (lists, idfs, limit, accept) => {
+    const normBase = K1 * (1 - B);
+    const normPerLength = (K1 * B) / (totalLength / docs.size);
+    const lengthOf = lengths;
+    const scoreOf = scores;
+    lists.forEach((list) => list.refreshBlocks(lengthOf));
+
+    const bounds = lists.map(({ maxFreq, minLength }, n) => (
+      idfs[n] * ((maxFreq * (K1 + 1)) / (maxFreq + normBase + normPerLength * minLength))
+    ));
+    const order = lists.map((list, n) => n).sort((a, b) => bounds[a] - bounds[b]);
+    const count = order.length;
+    const ids = order.map((n) => lists[n].ids);
+    const freqs = order.map((n) => lists[n].freqs);
+    const blockMaxFreqs = order.map((n) => lists[n].blockMaxFreq);
+    const blockMinLengths = order.map((n) => lists[n].blockMinLength);
+    const idf = Float64Array.from(order, (n) => idfs[n]);
+    const listBounds = Float64Array.from(order, (n) => bounds[n]);
+    const positions = Int32Array.from(order, (n) => lists[n].length - 1);
+    // upTo[i]: the most lists 0..i can add to a score
+    const upTo = new Float64Array(count);
+    listBounds.forEach((listBound, i) => {
+      upTo[i] = (i > 0 ? upTo[i - 1] : 0) + listBound;
+    });
+    const contributions = new Float64Array(count);
+    // Bound of the block under each cursor, cached until the cursor leaves it
+    const blocks = new Int32Array(count).fill(-1);
+    const blockBounds = new Float64Array(count);
+
+    // Moves cursor i down to the last posting with an id <= `id`, galloping
+    // first since it may be far behind
+    const seek = (i, id) => {
+      const list = ids[i];
+      let low = positions[i];
+      if (low >= 0 && list[low] > id) {
+        let high = low;
+        let step = 1;
+        low -= 1;
+        while (low >= 0 && list[low] > id) {
+          high = low;
+          step *= 2;
+          low = high - step;
+        }
+        low = Math.max(low, -1);
+        while (high - low > 1) {
+          const mid = (low + high) >> 1;
+          if (list[mid] > id) {
+            high = mid;
+          } else {
+            low = mid;
+          }
+        }
+        positions[i] = low;
+      }
+      return low;
+    };
+
+    const heap = new Int32Array(Math.min(limit, docs.size));
+    // Every doc whose score went into the scratch array, to reset afterwards
+    const written = [];
+    let size = 0;
+    // Score a doc has to beat. A doc that can at best tie it is skipped too,
+    // since it would lose the tie; the cutoff adds a margin far above the
+    // rounding error of summing a few bounds, but far below any real gap.
+    let threshold = -Infinity;
+    let cutoff = -Infinity;
+    let firstEssential = 0;
+    // Lists from here up are required (see the single-list walk below)
+    let firstRequired = count;
+    // Lowest id the last block check covered without ruling it out; until the
+    // walk passes it or the cutoff rises, the same check would fail again
+    let checkedFloor = Infinity;
+
+    for (;;) {
+      // With one essential list left, walk it here without the bookkeeping
+      // below, stepping over postings that fall short even with every other
+      // list's bound. A list whose bound the cutoff can't do without is
+      // required: a doc missing from it can't make the cut either, so the
+      // walk leapfrogs to the next id found in every required list.
+      if (firstEssential === count - 1 && firstEssential > 0) {
+        const e = firstEssential;
+        const list = ids[e];
+        const listFreqs = freqs[e];
+        const weight = idf[e];
+        const rest = upTo[e - 1];
+        let position = positions[e];
+        while (position >= 0) {
+          const id = list[position];
+          const freq = listFreqs[position];
+          if (weight * ((freq * (K1 + 1)) / (freq + normBase + normPerLength * lengthOf[id])) + rest <= cutoff) {
+            position -= 1;
+            continue;
+          }
+          let next = id;
+          for (let r = firstRequired; r < e && next === id; r++) {
+            const at = seek(r, id);
+            next = at >= 0 ? ids[r][at] : -1;
+          }
+          if (next === id) {
+            break;
+          }
+          positions[e] = position;
+          position = next >= 0 ? seek(e, next) : -1;
+        }
+        positions[e] = position;
+      }
+
+      // Next candidate: the highest unread id in the essential lists
+      let doc = -1;
+      for (let i = firstEssential; i < count; i++) {
+        const position = positions[i];
+        if (position >= 0 && ids[i][position] > doc) {
+          doc = ids[i][position];
+        }
+      }
+      if (doc === -1) {
+        break;
+      }
+
+      // Every essential posting from the highest block start up to doc sits
+      // in the block under its list's cursor, so with the non-essential
+      // lists' bounds, those blocks' bounds cover every doc in that range
+      if (size === heap.length && doc < checkedFloor) {
+        let best = firstEssential > 0 ? upTo[firstEssential - 1] : 0;
+        let floor = 0;
+        for (let i = firstEssential; i < count; i++) {
+          const position = positions[i];
+          if (position >= 0) {
+            const block = position >> BLOCK_SHIFT;
+            if (block !== blocks[i]) {
+              const freq = blockMaxFreqs[i][block];
+              blocks[i] = block;
+              blockBounds[i] = idf[i] * ((freq * (K1 + 1)) / (freq + normBase + normPerLength * blockMinLengths[i][block]));
+            }
+            best += blockBounds[i];
+            floor = Math.max(floor, ids[i][block << BLOCK_SHIFT]);
+          }
+        }
+        if (best <= cutoff) {
+          for (let i = firstEssential; i < count; i++) {
+            seek(i, floor - 1);
+          }
+          continue;
+        }
+        checkedFloor = floor;
+      }
+
+      const norm = normBase + normPerLength * lengthOf[doc];
+      let score = 0;
+      for (let i = firstEssential; i < count; i++) {
+        const position = positions[i];
+        let contribution = 0;
+        if (position >= 0 && ids[i][position] === doc) {
+          const freq = freqs[i][position];
+          contribution = idf[i] * ((freq * (K1 + 1)) / (freq + norm));
+          positions[i] = position - 1;
+        }
+        contributions[i] = contribution;
+        score += contribution;
+      }
+
+      // Non-essential lists, biggest bound first, while the doc can still make it
+      let i = firstEssential - 1;
+      for (; i >= 0; i--) {
+        if (score + upTo[i] <= cutoff) {
+          break;
+        }
+        const position = seek(i, doc);
+        let contribution = 0;
+        if (position >= 0 && ids[i][position] === doc) {
+          const freq = freqs[i][position];
+          contribution = idf[i] * ((freq * (K1 + 1)) / (freq + norm));
+          positions[i] = position - 1;
+        }
+        contributions[i] = contribution;
+        score += contribution;
+      }
+      if (i >= 0) {
+        continue;
+      }
+
+      // Final score summed in list order, so equal docs get equal scores
+      // whichever lists were essential when they were read
+      score = 0;
+      for (let n = 0; n < count; n++) {
+        score += contributions[n];
+      }
+      if ((size === heap.length && score <= threshold) || (accept && !accept(doc))) {
+        continue;
+      }
+
+      scoreOf[doc] = score;
+      written.push(doc);
+      if (size < heap.length) {
+        heap[size] = doc;
+        heapUp(heap, size++, scoreOf);
+      } else {
+        heap[0] = doc;
+        heapDown(heap, size, 0, scoreOf);
+      }
+      if (size === heap.length) {
+        threshold = scoreOf[heap[0]];
+        cutoff = threshold + 1e-12 * Math.abs(threshold);
+        checkedFloor = Infinity;
+        while (firstEssential < count && upTo[firstEssential] <= cutoff) {
+          firstEssential += 1;
+        }
+        while (firstRequired > 0 && upTo[count - 1] - listBounds[firstRequired - 1] <= cutoff) {
+          firstRequired -= 1;
+        }
+      }
+    }
+
+    const results = Array.from(heap.subarray(0, size))
+      .sort((a, b) => (ranksAbove(scoreOf, a, b) ? -1 : 1))
+      .map((id) => ({ id, score: scoreOf[id] }));
+    written.forEach((id) => {
+      scoreOf[id] = 0;
+    });
+    return results;
+  };
+
+  // Returns [{ id, score, row }] best first. `filter(row)`, when given, applies
+  // structured filters to the ranked candidates.
+  const search = (query, { limit = 20, filter = null } = {}) => {
+    const tokens = tokenize(query);
+    if (tokens.length === 0 || docs.size === 0 || limit < 1) {
+      return [];
+    }
+
+    const lastToken = tokens[tokens.length - 1];
+    const groups = tokens.slice(0, -1).map((token) => [token]);
+    groups.push(expandPrefix(lastToken));
+    const lists = groups.flat().map((term) => postings.get(term)).filter((list) => list && list.length > 0);
+    if (lists.length === 0) {
+      return [];
+    }
+
+    const idfs = lists.map((list) => Math.log(1 + (docs.size - list.length + 0.5) / (list.length + 0.5)));
+    const accept = filter ? (id) => filter(docs.get(id).row) : null;
+    const ranked = lists.length > MAX_PRUNED_TERMS
+      ? searchExhaustive(lists, idfs, limit, accept)
+      : searchPruned(lists, idfs, limit, accept);
+    return ranked.map(({ id, score }) => ({ id, score, row: docs.get(id).row }));
+  };
+
+  return {
+    add,
+    remove,
+    apply,
+    search,
+    stats: () => ({ documents: docs.size, terms: postings.size }),
+  };
+};
+
+module.exports = { createSearchIndex };
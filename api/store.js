@@ -0,0 +1,273 @@
+// In-memory data store for the mock API.
+//
+// Mirrors the tables in database/schema.sql that the API reads and writes, and
+// keeps per-query timings so /health can report where time goes.
+
+// Reference rows match the sample data inserted by database/schema.sql
+const SEED = {
+  customers: [
+    { customer_id: 1, customer_name: 'TechCorp Solutions', customer_code: 'TCS001', is_active: true },
+    { customer_id: 2, customer_name: 'InnovateSoft Inc', customer_code: 'ISI002', is_active: true },
+    { customer_id: 3, customer_name: 'Digital Dynamics', customer_code: 'DD003', is_active: true },
+  ],
+  skillset_categories: [
+    { category_id: 1, category_name: 'Frontend Development', description: 'Frontend technologies and frameworks', is_active: true },
+    { category_id: 2, category_name: 'Backend Development', description: 'Backend technologies and server-side development', is_active: true },
+    { category_id: 3, category_name: 'Full Stack Development', description: 'Both frontend and backend development', is_active: true },
+    { category_id: 4, category_name: 'DevOps', description: 'DevOps and infrastructure management', is_active: true },
+    { category_id: 5, category_name: 'Data Science', description: 'Data analysis and machine learning', is_active: true },
+    { category_id: 6, category_name: 'Mobile Development', description: 'Mobile app development', is_active: true },
+  ],
+  engagement_modes: [
+    { mode_id: 1, mode_name: 'Onsite', description: 'Work from client location', is_active: true },
+    { mode_id: 2, mode_name: 'Remote', description: 'Work from anywhere', is_active: true },
+    { mode_id: 3, mode_name: 'Hybrid', description: 'Combination of onsite and remote work', is_active: true },
+    { mode_id: 4, mode_name: 'Contract', description: 'Fixed-term contract work', is_active: true },
+    { mode_id: 5, mode_name: 'Full-time', description: 'Permanent full-time position', is_active: true },
+  ],
+  users: [
+    { user_id: 1, username: 'admin', email: 'admin@rectool.com', full_name: 'System Administrator', role: 'admin', is_active: true },
+    { user_id: 2, username: 'hr1', email: 'hr1@rectool.com', full_name: 'Sarah Johnson', role: 'hr', is_active: true },
+    { user_id: 3, username: 'recruiter1', email: 'recruiter1@rectool.com', full_name: 'John Doe', role: 'recruiter', is_active: true },
+    { user_id: 4, username: 'manager1', email: 'manager1@rectool.com', full_name: 'Jane Smith', role: 'manager', is_active: true },
+  ],
+  // Not tables in the schema, but served alongside the reference tables
+  job_statuses: [
+    { status_id: 1, status_name: 'Open' },
+    { status_id: 2, status_name: 'In Progress' },
+    { status_id: 3, status_name: 'On Hold' },
+    { status_id: 4, status_name: 'Closed' },
+  ],
+  currencies: [
+    { currency_code: 'USD', currency_name: 'US Dollar' },
+    { currency_code: 'INR', currency_name: 'Indian Rupee' },
+    { currency_code: 'EUR', currency_name: 'Euro' },
+    { currency_code: 'GBP', currency_name: 'British Pound' },
+  ],
+};
+
+const createMemoryStore = ({ onQuery = null } = {}) => {
+  // Job descriptions are kept in creation order (sorted by created_at, id) with
+  // an id index next to them, the same way the table has a PK and idx_created_date.
+  const jobs = [];
+  const jobsById = new Map();
+  const jobStatus = [];
+  const tables = Object.fromEntries(
+    Object.entries(SEED).map(([name, rows]) => [name, rows.map((row) => ({ ...row }))])
+  );
+  let nextJobId = 1;
+  let nextStatusId = 1;
+
+  // Listeners are told which table changed after every write, along with
+  // { type: 'insert' | 'update' | 'delete', row, previous } for job descriptions
+  const listeners = [];
+  const notify = (table, change = null) => listeners.forEach((listener) => listener(table, change));
+
+  // Position of a job in the creation-ordered array
+  const indexOfJob = (jd) => {
+    let lo = 0;
+    let hi = jobs.length;
+    while (lo < hi) {
+      const mid = (lo + hi) >> 1;
+      const other = jobs[mid];
+      if (other.created_at < jd.created_at || (other.created_at === jd.created_at && other.id < jd.id)) {
+        lo = mid + 1;
+      } else {
+        hi = mid;
+      }
+    }
+    return jobs[lo] === jd ? lo : -1;
+  };
+
+  // Like indexOfJob, but refuses to go on if the ordered array and the id index
+  // disagree; writing to jobs[-1] or splicing at -1 would corrupt the store
+  const positionOf = (jd) => {
+    const index = indexOfJob(jd);
+    if (index === -1) {
+      throw new Error(`Job ${jd.id} is missing from the ordered index`);
+    }
+    return index;
+  };
+
+  const recordStatus = (jdId, status, changedBy, notes = null) => {
+    const row = {
+      status_id: nextStatusId++,
+      jd_id: jdId,
+      status,
+      status_notes: notes,
+      changed_by: changedBy,
+      changed_at: new Date().toISOString(),
+    };
+    jobStatus.push(row);
+    return row;
+  };
+
+  // Builds a stored job row. The key columns are set after the caller's data
+  // so an imported id can't replace the primary key. The literal starts with
+  // `id` on purpose: V8 gives every `{ ...data, id }` object its own hidden
+  // class, which makes each filter over the store megamorphic.
+  const buildRow = (id, data, createdAt) => {
+    const jd = { id, ...data, created_at: createdAt };
+    jd.id = id;
+    return jd;
+  };
+
+  // Creation time for new rows. A clock that steps backwards (an NTP
+  // correction, say) must not put a row before the current last one, or the
+  // (created_at, id) order that the cursors and indexOfJob rely on breaks.
+  // ISO timestamps compare correctly as strings.
+  const nextCreatedAt = () => {
+    const now = new Date().toISOString();
+    const last = jobs.length ? jobs[jobs.length - 1].created_at : '';
+    return now < last ? last : now;
+  };
+
+  const timings = {};
+
+  // Wraps a store operation so its call count and total/max time are recorded;
+  // onQuery(name, ms) also sees every call, e.g. to attribute it to a request
+  const timed = (name, fn) => (...args) => {
+    const started = process.hrtime.bigint();
+    try {
+      return fn(...args);
+    } finally {
+      const elapsed = Number(process.hrtime.bigint() - started) / 1e6;
+      const entry = timings[name] || (timings[name] = { count: 0, total_ms: 0, max_ms: 0 });
+      entry.count += 1;
+      entry.total_ms += elapsed;
+      entry.max_ms = Math.max(entry.max_ms, elapsed);
+      if (onQuery) {
+        onQuery(name, elapsed);
+      }
+    }
+  };
+
+  return {
+    // Ordered view used by the list endpoint; callers must not mutate it
+    jobs,
+
+    getJob: timed('getJob', (id) => jobsById.get(Number(id)) || null),
+
+    insertJob: timed('insertJob', (data, changedBy = null) => {
+      const jd = buildRow(nextJobId++, data, nextCreatedAt());
+      jobs.push(jd);
+      jobsById.set(jd.id, jd);
+      recordStatus(jd.id, jd.jd_status || 'Open', changedBy);
+      notify('job_descriptions', { type: 'insert', row: jd, previous: null });
+      return jd;
+    }),
+
+    // Batch insert used by the bulk importer: one timestamp and one pass for
+    // the whole chunk, with the matching job_status rows
+    insertJobs: timed('insertJobs', (rows) => {
+      const createdAt = nextCreatedAt();
+      const inserted = rows.map((data) => {
+        const jd = buildRow(nextJobId++, data, createdAt);
+        jobs.push(jd);
+        jobsById.set(jd.id, jd);
+        jobStatus.push({
+          status_id: nextStatusId++,
+          jd_id: jd.id,
+          status: jd.jd_status || 'Open',
+          status_notes: null,
+          changed_by: jd.jd_created_by ?? null,
+          changed_at: createdAt,
+        });
+        return jd;
+      });
+      inserted.forEach((jd) => notify('job_descriptions', { type: 'insert', row: jd, previous: null }));
+      return inserted;
+    }),
+
+    // Rows are replaced rather than mutated so listeners can diff old and new
+    updateJob: timed('updateJob', (id, data, changedBy = null) => {
+      const previous = jobsById.get(Number(id));
+      if (!previous) {
+        return null;
+      }
+      const index = positionOf(previous);
+      const jd = buildRow(previous.id, { ...previous, ...data }, previous.created_at);
+      jobs[index] = jd;
+      jobsById.set(jd.id, jd);
+      if (jd.jd_status !== previous.jd_status) {
+        recordStatus(jd.id, jd.jd_status, changedBy);
+      }
+      notify('job_descriptions', { type: 'update', row: jd, previous });
+      return jd;
+    }),
+
+    // Equivalent of sp_update_job_status: history row plus the status on the job
+    updateJobStatus: timed('updateJobStatus', (id, status, notes = null, changedBy = null) => {
+      const previous = jobsById.get(Number(id));
+      if (!previous) {
+        return null;
+      }
+      const index = positionOf(previous);
+      recordStatus(previous.id, status, changedBy, notes);
+      const jd = buildRow(previous.id, {
+        ...previous,
+        jd_status: status,
+        jd_updated_by: changedBy ?? previous.jd_updated_by,
+      }, previous.created_at);
+      jobs[index] = jd;
+      jobsById.set(jd.id, jd);
+      notify('job_descriptions', { type: 'update', row: jd, previous });
+      return jd;
+    }),
+
+    deleteJob: timed('deleteJob', (id) => {
+      const previous = jobsById.get(Number(id));
+      if (!previous) {
+        return null;
+      }
+      jobs.splice(positionOf(previous), 1);
+      jobsById.delete(previous.id);
+      // job_status rows cascade with the job, as in the schema
+      for (let i = jobStatus.length - 1; i >= 0; i--) {
+        if (jobStatus[i].jd_id === previous.id) {
+          jobStatus.splice(i, 1);
+        }
+      }
+      notify('job_descriptions', { type: 'delete', row: null, previous });
+      return previous;
+    }),
+
+    getStatusHistory: timed('getStatusHistory', (jdId) => jobStatus.filter((row) => row.jd_id === Number(jdId))),
+
+    listTable: timed('listTable', (name) => {
+      if (!tables[name]) {
+        throw new Error(`Unknown table: ${name}`);
+      }
+      return tables[name];
+    }),
+
+    insertRow: timed('insertRow', (name, row) => {
+      if (!tables[name]) {
+        throw new Error(`Unknown table: ${name}`);
+      }
+      tables[name].push({ ...row });
+      notify(name);
+      return row;
+    }),
+
+    onChange: (listener) => {
+      listeners.push(listener);
+    },
+
+    stats: () => ({
+      backend: 'memory',
+      rows: {
+        job_descriptions: jobs.length,
+        job_status: jobStatus.length,
+        ...Object.fromEntries(Object.entries(tables).map(([name, rows]) => [name, rows.length])),
+      },
+      queries: Object.fromEntries(Object.entries(timings).map(([name, entry]) => [name, {
+        count: entry.count,
+        avg_ms: Number((entry.total_ms / entry.count).toFixed(3)),
+        max_ms: Number(entry.max_ms.toFixed(3)),
+      }])),
+    }),
+  };
+};
+
+module.exports = { createMemoryStore };
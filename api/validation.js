@@ -0,0 +1,63 @@
+// Server-side copy of jdService.validateJobData so imported rows are held to
+// the same rules as the JD entry form. Keep the two in step.
+
+const isBlank = (value) => value == null || String(value).trim() === '';
+
+const validateJobData = (data) => {
+  const errors = [];
+
+  if (isBlank(data.jd_title)) {
+    errors.push('Job Title is required');
+  }
+
+  if (!data.jd_customer_id) {
+    errors.push('Customer ID is required');
+  }
+
+  if (isBlank(data.jd_consumer)) {
+    errors.push('Consumer is required');
+  }
+
+  if (isBlank(data.jd_original)) {
+    errors.push('Original Job Description is required');
+  }
+
+  if (!data.jd_skillset?.length) {
+    errors.push('At least one skill is required');
+  }
+
+  if (!data.jd_mode) {
+    errors.push('Job Mode is required');
+  }
+
+  if (!data.jd_tenure || data.jd_tenure < 1) {
+    errors.push('Valid Tenure is required');
+  }
+
+  if (!data.jd_op_exp_min || data.jd_op_exp_min < 0) {
+    errors.push('Valid Minimum Experience is required');
+  }
+
+  if (!data.jd_op_exp_max || data.jd_op_exp_max < data.jd_op_exp_min) {
+    errors.push('Valid Maximum Experience is required and must be greater than minimum');
+  }
+
+  if (!data.jd_op_budget_min || data.jd_op_budget_min < 0) {
+    errors.push('Valid Minimum Budget is required');
+  }
+
+  if (!data.jd_op_budget_max || data.jd_op_budget_max < data.jd_op_budget_min) {
+    errors.push('Valid Maximum Budget is required and must be greater than minimum');
+  }
+
+  if (!data.jd_created_by) {
+    errors.push('Created By is required');
+  }
+
+  return {
+    isValid: errors.length === 0,
+    errors
+  };
+};
+
+module.exports = { validateJobData };
@@ -74,7 +74,6 @@ CREATE TABLE IF NOT EXISTS job_descriptions (
     jd_available_pos VARCHAR(50) NULL COMMENT 'Available Positions',
     jd_revenue_potential VARCHAR(100) NULL COMMENT 'Revenue Potential',
     jd_keywords JSON NULL COMMENT 'Tech Keywords of JD',
-    jd_aging INT GENERATED ALWAYS AS (DATEDIFF(CURDATE(), DATE(jd_created_date))) STORED COMMENT 'How old is this JD',
     jd_active BOOLEAN NOT NULL DEFAULT TRUE COMMENT 'Active status',
     jd_status VARCHAR(50) NOT NULL DEFAULT 'Open' COMMENT 'Shows the status of the JD',
     jd_created_by INT NOT NULL COMMENT 'HR or recruiter who entered the JD',
@@ -109,7 +108,6 @@ CREATE TABLE IF NOT EXISTS job_descriptions (
     INDEX idx_status (jd_status),
     INDEX idx_active (jd_active),
     INDEX idx_created_date (jd_created_date),
-    INDEX idx_aging (jd_aging),
     INDEX idx_created_by (jd_created_by),
     INDEX idx_updated_by (jd_updated_by),
     
@@ -117,7 +115,6 @@ CREATE TABLE IF NOT EXISTS job_descriptions (
     FULLTEXT idx_title_search (jd_title),
     FULLTEXT idx_consumer_search (jd_consumer),
     FULLTEXT idx_original_search (jd_original),
-    FULLTEXT idx_keywords_search (jd_keywords),
     FULLTEXT idx_special_instruction_search (jd_special_instruction)
     
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
@@ -244,7 +241,7 @@ SELECT
     jd.jd_op_budget_min,
     jd.jd_op_budget_max,
     jd.jd_status,
-    jd.jd_aging,
+    DATEDIFF(CURDATE(), DATE(jd.jd_created_date)) as jd_aging,
     jd.jd_created_date,
     u.full_name as created_by
 FROM job_descriptions jd
@@ -353,13 +350,12 @@ BEGIN
 END //
 
 -- Procedure to calculate JD aging
+-- Aging is derived from jd_created_date on read (see v_active_jobs), so no rows
+-- are rewritten. "Aging >= N days" filters should be written as
+-- jd_created_date < CURDATE() - INTERVAL (N - 1) DAY to use idx_created_date.
 CREATE PROCEDURE sp_calculate_jd_aging()
 BEGIN
-    UPDATE job_descriptions 
-    SET jd_aging = DATEDIFF(CURDATE(), DATE(jd_created_date))
-    WHERE jd_active = TRUE;
-    
-    SELECT 'JD aging calculated successfully' as message;
+    SELECT 'JD aging is computed on read' as message, 0 as rows_touched;
 END //
 
 DELIMITER ;
@@ -439,7 +435,6 @@ MODIFY COLUMN jd_open_position INT COMMENT 'No of positions',
 MODIFY COLUMN jd_available_pos VARCHAR(50) COMMENT 'Available Positions',
 MODIFY COLUMN jd_revenue_potential VARCHAR(100) COMMENT 'Revenue Potential',
 MODIFY COLUMN jd_keywords JSON COMMENT 'Tech Keywords of JD',
-MODIFY COLUMN jd_aging INT COMMENT 'How old is this JD',
 MODIFY COLUMN jd_active BOOLEAN COMMENT 'Active status',
 MODIFY COLUMN jd_status VARCHAR(50) COMMENT 'Shows the status of the JD',
 MODIFY COLUMN jd_created_by INT COMMENT 'HR or recruiter who entered the JD',
@@ -102,17 +102,13 @@ const JDEntry = () => {
 
   const loadReferenceData = async () => {
     try {
-      const [categoriesRes, statusesRes, usersRes, currenciesRes] = await Promise.all([
-        jdService.getCategories(),
-        jdService.getStatuses(),
-        jdService.getUsers(),
-        jdService.getCurrencies()
-      ]);
+      const response = await jdService.getReferenceData();
+      const reference = response.data || {};
 
-      setCategories(categoriesRes.data || []);
-      setStatuses(statusesRes.data || []);
-      setUsers(usersRes.data || []);
-      setCurrencies(currenciesRes.data || []);
+      setCategories(reference.categories || []);
+      setStatuses(reference.statuses || []);
+      setUsers(reference.users || []);
+      setCurrencies(reference.currencies || []);
     } catch (error) {
       toast.error('Failed to load reference data');
     }
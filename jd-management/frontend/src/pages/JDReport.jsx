@@ -8,6 +8,8 @@ import SectionHeader from '../components/SectionHeader';
 const JDReport = () => {
   const [jobs, setJobs] = useState([]);
   const [loading, setLoading] = useState(true);
+  const [nextCursor, setNextCursor] = useState(null);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [selectedJob, setSelectedJob] = useState(null);
   const [showModal, setShowModal] = useState(false);
   const location = useLocation();
@@ -22,6 +24,7 @@ const JDReport = () => {
       setLoading(true);
       const response = await jdService.getAllJobs();
       setJobs(response.data || []);
+      setNextCursor(response.next_cursor || null);
     } catch (error) {
       toast.error('Failed to load job descriptions');
       console.error('Error loading jobs:', error);
@@ -30,6 +33,20 @@ const JDReport = () => {
     }
   };
 
+  const loadMoreJobs = async () => {
+    try {
+      setLoadingMore(true);
+      const response = await jdService.getAllJobs({ cursor: nextCursor });
+      setJobs((prev) => [...prev, ...(response.data || [])]);
+      setNextCursor(response.next_cursor || null);
+    } catch (error) {
+      toast.error('Failed to load more job descriptions');
+      console.error('Error loading jobs:', error);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   const handleDelete = async (jobId) => {
     if (window.confirm('Are you sure you want to delete this job description?')) {
       try {
@@ -42,9 +59,18 @@ const JDReport = () => {
     }
   };
 
-  const handleView = (job) => {
+  const handleView = async (job) => {
     setSelectedJob(job);
     setShowModal(true);
+    // The list omits the long text columns, so fetch the full record for the modal
+    try {
+      const response = await jdService.getJobById(job.jd_id);
+      if (response.data) {
+        setSelectedJob(response.data);
+      }
+    } catch (error) {
+      console.error('Error loading job details:', error);
+    }
   };
 
   const formatSkills = (skills) => {
@@ -141,15 +167,15 @@ const JDReport = () => {
                  </span>
                </div>
                <div className="flex items-center space-x-3">
-                 <button
-                   onClick={() => window.print()}
+                 <a
+                   href={jdService.getExportUrl('csv')}
                    className="inline-flex items-center px-3 py-2 text-sm font-medium text-gray-700 bg-white border border-gray-300 rounded-md hover:bg-gray-50 transition-colors"
                  >
                    <svg className="h-4 w-4 mr-2" fill="none" stroke="currentColor" viewBox="0 0 24 24">
                      <path strokeLinecap="round" strokeLinejoin="round" strokeWidth={2} d="M17 17h2a2 2 0 002-2v-4a2 2 0 00-2-2H5a2 2 0 00-2 2v4a2 2 0 002 2h2m2 4h6a2 2 0 002-2v-4a2 2 0 00-2-2H9a2 2 0 00-2 2v4a2 2 0 002 2zm8-12V5a2 2 0 00-2-2H9a2 2 0 00-2 2v4h10z" />
                    </svg>
                    Export
-                 </button>
+                 </a>
                  <Link
                    to="/"
                    className="inline-flex items-center px-4 py-2 text-sm font-medium text-white bg-blue-600 rounded-md hover:bg-blue-700 transition-colors"
@@ -252,6 +278,18 @@ const JDReport = () => {
                </Link>
              </div>
            )}
+
+          {nextCursor && (
+            <div className="px-6 py-4 border-t border-gray-200 text-center">
+              <button
+                onClick={loadMoreJobs}
+                disabled={loadingMore}
+                className="inline-flex items-center px-4 py-2 text-sm font-medium text-gray-700 bg-white border border-gray-300 rounded-md hover:bg-gray-50 transition-colors disabled:opacity-50"
+              >
+                {loadingMore ? 'Loading...' : 'Load more'}
+              </button>
+            </div>
+          )}
         </div>
       </div>
 
@@ -20,8 +20,16 @@ api.interceptors.response.use(
 
 const jdService = {
   // Job Description CRUD operations
-  getAllJobs: async () => {
-    const response = await api.get('/api/jd');
+  // params: { limit, cursor, fields, status, mode, customer_id, category_id,
+  //           exp_min, exp_max, budget_min, budget_max, aging_min, aging_max }
+  getAllJobs: async (params = {}) => {
+    const response = await api.get('/api/jd', { params });
+    return response.data;
+  },
+
+  // params: { q, limit, fields } plus any of the getAllJobs filters
+  searchJobs: async (q, params = {}) => {
+    const response = await api.get('/api/jd/search', { params: { ...params, q } });
     return response.data;
   },
 
@@ -45,12 +53,36 @@ const jdService = {
     return response.data;
   },
 
+  updateJobStatus: async (id, status, notes, changedBy) => {
+    const response = await api.put(`/api/jd/${id}/status`, { status, notes, changed_by: changedBy });
+    return response.data;
+  },
+
+  getJobSummary: async () => {
+    const response = await api.get('/api/jd/summary');
+    return response.data;
+  },
+
+  getCustomerSummary: async () => {
+    const response = await api.get('/api/customers/summary');
+    return response.data;
+  },
+
+  // Download link for the streamed export; params take the getAllJobs filters
+  getExportUrl: (format = 'csv', params = {}) => api.getUri({ url: '/api/jd/export', params: { ...params, format } }),
+
   updateAging: async () => {
     const response = await api.post('/api/jd/update-aging');
     return response.data;
   },
 
   // Reference data endpoints
+  // Categories, modes, statuses, users and currencies in one request
+  getReferenceData: async () => {
+    const response = await api.get('/api/reference');
+    return response.data;
+  },
+
   getCategories: async () => {
     const response = await api.get('/api/categories');
     return response.data;
@@ -88,6 +120,11 @@ const jdService = {
     return response.data;
   },
 
+  scanJobDescriptions: async (jdTexts) => {
+    const response = await api.post('/api/jd/scan/batch', { texts: jdTexts });
+    return response.data;
+  },
+
   // Utility methods
   formatSkills: (skills) => {
     if (!skills) return 'N/A';
@@ -0,0 +1,90 @@
+#!/usr/bin/env node
+// Benchmarks GET /api/jd/export's streaming writer (api/jdExport.js).
+//
+// Seeds a store with --rows generated job descriptions, then serves each
+// format from a local HTTP server with the same chunked reader the route uses
+// and downloads it over a real socket. Reports time to first byte, total
+// time, bytes sent and the peak RSS while the export ran, next to the RSS
+// before it started (the seeded store alone). The data comes from --seed, so
+// runs with the same options are comparable.
+//
+// Usage: npm run bench:export -- [--rows 1000000] [--formats csv,jsonl,xlsx] [--seed 42]
+
+const http = require('http');
+
+const { createMemoryStore } = require('../api/store');
+const { streamExport, EXPORT_FORMATS } = require('../api/jdExport');
+const { exportChunks } = require('../api/jobList');
+const { option, seedStore } = require('./benchUtils');
+
+const ROWS = Number(option('rows', 1000000));
+const FORMATS = String(option('formats', 'csv,jsonl,xlsx')).split(',');
+const SEED = Number(option('seed', 42));
+
+const store = createMemoryStore();
+
+const rssMb = () => Number((process.memoryUsage().rss / 1048576).toFixed(1));
+const elapsedMs = (started) => Number(process.hrtime.bigint() - started) / 1e6;
+
+const server = http.createServer((req, res) => {
+  const url = new URL(req.url, 'http://localhost');
+  const format = url.searchParams.get('format');
+  const now = new Date();
+  res.setHeader('Content-Type', EXPORT_FORMATS[format].contentType);
+  streamExport(res, exportChunks(store.jobs, Object.fromEntries(url.searchParams), { now }), { format, store, now })
+    .catch((error) => res.destroy(error));
+});
+
+// Downloads one export, discarding the body, and samples RSS while it runs
+const download = (port, format) => new Promise((resolve, reject) => {
+  let peakRss = rssMb();
+  const sampler = setInterval(() => {
+    peakRss = Math.max(peakRss, rssMb());
+  }, 5);
+  const started = process.hrtime.bigint();
+  let ttfb = null;
+  let bytes = 0;
+
+  http.get({ port, path: `/export?format=${format}` }, (res) => {
+    res.on('data', (chunk) => {
+      if (ttfb === null) {
+        ttfb = elapsedMs(started);
+      }
+      bytes += chunk.length;
+    });
+    res.on('end', () => {
+      clearInterval(sampler);
+      resolve({
+        ttfb_ms: Number(ttfb.toFixed(1)),
+        total_ms: Number(elapsedMs(started).toFixed(1)),
+        mb_sent: Number((bytes / 1048576).toFixed(1)),
+        peak_rss_mb: Math.max(peakRss, rssMb()),
+      });
+    });
+  }).on('error', (error) => {
+    clearInterval(sampler);
+    reject(error);
+  });
+});
+
+const main = async () => {
+  console.log(`📦 Seeding ${ROWS} job descriptions (seed ${SEED})`);
+  seedStore(store, ROWS, SEED);
+
+  await new Promise((resolve) => server.listen(0, resolve));
+  const { port } = server.address();
+
+  const results = {};
+  for (const format of FORMATS) {
+    const rssBefore = rssMb();
+    results[format] = { rss_before_mb: rssBefore, ...(await download(port, format)) };
+  }
+
+  server.close();
+  console.table(results);
+};
+
+main().catch((error) => {
+  console.error('❌ Export benchmark failed:', error.message);
+  process.exit(1);
+});
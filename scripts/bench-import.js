@@ -0,0 +1,89 @@
+#!/usr/bin/env node
+// Benchmarks POST /api/jd/import's bulk path (api/bulkImport.js) against
+// inserting the same rows one at a time.
+//
+// Generates --rows job descriptions, writes them out as CSV and as JSONL, and
+// feeds each file to importJobs as a stream of 64 KB chunks, as a request body
+// would arrive. The per-row path parses each row as its own JSON body,
+// validates it with the same rules and calls store.insertJob, the way one
+// POST /api/jd per row does (without the HTTP round trip, or the 1 s delay
+// the mock adds to each save). Every case starts from an empty store. The
+// data comes from --seed, so runs with the same options are comparable.
+//
+// Usage: npm run bench:import -- [--rows 100000] [--chunk-size 1000] [--seed 42]
+
+const { Readable } = require('stream');
+
+const { createMemoryStore } = require('../api/store');
+const { importJobs } = require('../api/bulkImport');
+const { validateJobData } = require('../api/validation');
+const { option, createRandom, generateJob } = require('./benchUtils');
+
+const ROWS = Number(option('rows', 100000));
+const CHUNK_SIZE = Number(option('chunk-size', 1000));
+const SEED = Number(option('seed', 42));
+
+const STREAM_CHUNK_BYTES = 64 * 1024;
+
+const random = createRandom(SEED);
+const jobs = Array.from({ length: ROWS }, () => generateJob(random));
+
+const csvCell = (value) => {
+  const text = Array.isArray(value) ? JSON.stringify(value) : String(value ?? '');
+  return /[",\r\n]/.test(text) ? `"${text.replace(/"/g, '""')}"` : text;
+};
+
+const columns = Object.keys(jobs[0]);
+const files = {
+  csv: `${columns.join(',')}\n${jobs.map((jd) => columns.map((column) => csvCell(jd[column])).join(',')).join('\n')}\n`,
+  jsonl: `${jobs.map((jd) => JSON.stringify(jd)).join('\n')}\n`,
+};
+
+function* chunksOf(text) {
+  for (let i = 0; i < text.length; i += STREAM_CHUNK_BYTES) {
+    yield text.slice(i, i + STREAM_CHUNK_BYTES);
+  }
+}
+
+const elapsedMs = (started) => Number(process.hrtime.bigint() - started) / 1e6;
+
+const report = (imported, ms, extra = {}) => ({
+  rows: imported,
+  ...extra,
+  total_ms: Number(ms.toFixed(1)),
+  rows_per_s: Math.round(imported / (ms / 1000)),
+});
+
+const main = async () => {
+  const results = {};
+
+  for (const [format, text] of Object.entries(files)) {
+    const store = createMemoryStore();
+    const started = process.hrtime.bigint();
+    const summary = await importJobs(Readable.from(chunksOf(text)), store, { format, chunkSize: CHUNK_SIZE });
+    results[`importJobs ${format}`] = report(summary.imported, elapsedMs(started), {
+      mb: Number((Buffer.byteLength(text) / 1048576).toFixed(1)),
+      failed: summary.failed,
+    });
+  }
+
+  const store = createMemoryStore();
+  const started = process.hrtime.bigint();
+  let failed = 0;
+  files.jsonl.split('\n').filter(Boolean).forEach((body) => {
+    const jd = JSON.parse(body);
+    if (validateJobData(jd).errors.length) {
+      failed += 1;
+    } else {
+      store.insertJob(jd, jd.jd_created_by);
+    }
+  });
+  results['insertJob per row'] = report(store.jobs.length, elapsedMs(started), { mb: null, failed });
+
+  console.table(results);
+};
+
+main().catch((error) => {
+  console.error('❌ Import benchmark failed:', error.message);
+  process.exit(1);
+});
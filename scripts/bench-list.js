@@ -0,0 +1,71 @@
+#!/usr/bin/env node
+// Benchmarks GET /api/jd's paginated listing (api/jobList.js) against the old
+// full dump, which returned every row, long text columns included.
+//
+// For each size in --sizes the store is grown with generated job descriptions
+// and each case is timed in process: building the response and serializing it
+// with JSON.stringify, as res.json does. Payload size is the serialized length.
+// The data comes from --seed, so runs with the same options are comparable.
+//
+// Usage: npm run bench:list -- [--sizes 10000,100000,1000000] [--runs 200]
+//                              [--dump-runs 5] [--seed 42]
+
+const { createMemoryStore } = require('../api/store');
+const { decodeCursor, seekCursor, listPage } = require('../api/jobList');
+const {
+  option, seedStore, latencySummary, timeRuns, heapMb,
+} = require('./benchUtils');
+
+const SIZES = String(option('sizes', '10000,100000,1000000')).split(',').map(Number);
+const RUNS = Number(option('runs', 200));
+const DUMP_RUNS = Number(option('dump-runs', 5));
+const SEED = Number(option('seed', 42));
+
+const store = createMemoryStore();
+const jobs = store.jobs;
+
+const kb = (bytes) => Number((bytes / 1024).toFixed(1));
+
+// Times `respond()` (which returns the response body) and records its size
+const measure = (respond, runs) => {
+  const body = JSON.stringify(respond());
+  const samples = timeRuns(() => JSON.stringify(respond()), { runs, warmup: Math.min(5, runs) });
+  return { payload_kb: kb(Buffer.byteLength(body)), ...latencySummary(samples) };
+};
+
+// Same response the list endpoint builds
+const page = (query) => {
+  const start = query.cursor ? seekCursor(jobs, decodeCursor(query.cursor)) : jobs.length;
+  const { data, next_cursor: nextCursor } = listPage(jobs, query, { start });
+  return { success: true, data, count: data.length, next_cursor: nextCursor };
+};
+
+const results = {};
+SIZES.forEach((size) => {
+  seedStore(store, size - jobs.length, SEED + size);
+  console.log(`📦 ${jobs.length} rows, heap ${heapMb()} MB`);
+
+  // A cursor halfway down the list, as if the user had paged that far
+  const middle = jobs[jobs.length >> 1];
+  const midCursor = Buffer.from(JSON.stringify([middle.created_at, middle.id])).toString('base64url');
+
+  const cases = {
+    'page (limit 50)': () => page({ limit: 50 }),
+    'page at mid cursor': () => page({ limit: 50, cursor: midCursor }),
+    'filtered page': () => page({ limit: 50, status: 'Open', exp_min: 3 }),
+    'fields=jd_title,jd_status': () => page({ limit: 50, fields: 'jd_title,jd_status' }),
+  };
+  Object.entries(cases).forEach(([name, respond]) => {
+    results[`${size} ${name}`] = measure(respond, RUNS);
+  });
+
+  // The old handler: res.json({ success, data: jobDescriptions, count })
+  try {
+    results[`${size} full dump`] = measure(() => ({ success: true, data: jobs, count: jobs.length }), DUMP_RUNS);
+  } catch (error) {
+    // At around a million rows the JSON no longer fits in a single V8 string
+    results[`${size} full dump`] = { error: error.message };
+  }
+});
+
+console.table(results);
@@ -0,0 +1,89 @@
+#!/usr/bin/env node
+// Benchmarks the reference data endpoints (api/referenceCache.js), cold vs warm.
+//
+// Calls the cache's Express handlers directly with minimal request/response
+// objects, for each resource and the /api/reference bundle. "cold" uses a
+// cache with a zero TTL, so every request reads the store, serializes and
+// hashes the rows as an uncached endpoint would; "warm" serves the cached
+// buffer; "304" is a warm request whose If-None-Match matches the ETag.
+// --users adds generated users so the users list and bundle have some size.
+//
+// Usage: npm run bench:reference -- [--runs 2000] [--users 200]
+
+const { createMemoryStore } = require('../api/store');
+const { createReferenceCache } = require('../api/referenceCache');
+const { option, latencySummary, timeRuns } = require('./benchUtils');
+
+const RUNS = Number(option('runs', 2000));
+const USERS = Number(option('users', 200));
+
+const store = createMemoryStore();
+const firstUserId = store.listTable('users').length + 1;
+for (let i = 0; i < USERS; i++) {
+  store.insertRow('users', {
+    user_id: firstUserId + i,
+    username: `bench.user${i}`,
+    full_name: `Bench User ${i}`,
+    role: 'recruiter',
+  });
+}
+
+const cold = createReferenceCache(store, { ttlMs: 0 });
+const warm = createReferenceCache(store);
+
+// Just enough of Express's req/res for the handler
+const request = (headers = {}) => ({ get: (name) => headers[name] });
+const response = () => {
+  const res = {
+    statusCode: 200,
+    headers: {},
+    body: null,
+    set: (headers) => {
+      Object.assign(res.headers, headers);
+      return res;
+    },
+    type: () => res,
+    status: (code) => {
+      res.statusCode = code;
+      return res;
+    },
+    send: (body) => {
+      res.body = body;
+      return res;
+    },
+    end: () => res,
+    json: (body) => res.send(body),
+  };
+  return res;
+};
+
+const results = {};
+[...warm.resources, warm.bundle].forEach((name) => {
+  const coldHandler = cold.handler(name);
+  const warmHandler = warm.handler(name);
+
+  const first = response();
+  warmHandler(request(), first);
+  const matching = request({ 'If-None-Match': first.headers.ETag });
+  const check = response();
+  warmHandler(matching, check);
+  if (check.statusCode !== 304) {
+    throw new Error(`${name} did not answer a matching If-None-Match with 304`);
+  }
+
+  results[`${name} cold`] = {
+    bytes: first.body.length,
+    ...latencySummary(timeRuns(() => coldHandler(request(), response()), { runs: RUNS })),
+  };
+  results[`${name} warm`] = {
+    bytes: first.body.length,
+    ...latencySummary(timeRuns(() => warmHandler(request(), response()), { runs: RUNS })),
+  };
+  results[`${name} 304`] = {
+    bytes: 0,
+    ...latencySummary(timeRuns(() => warmHandler(matching, response()), { runs: RUNS })),
+  };
+});
+
+console.table(results);
+console.log('🗄️  Warm cache:', warm.stats());
@@ -0,0 +1,82 @@
+#!/usr/bin/env node
+// Benchmarks the JD scanner behind POST /api/jd/scan (api/jdScanner.js).
+//
+// Reports how long the dictionary automaton takes to build on first use, then
+// the documents per second for short JDs (a couple of sentences) and for 20 KB
+// JDs: on the calling thread with extract(), and through scanBatch, which
+// spreads large batches across the worker pool. The scanner cache is disabled
+// so every document is scanned. The text comes from --seed, so runs with the
+// same options are comparable.
+//
+// Usage: npm run bench:scan -- [--short 20000] [--long 500] [--seed 42]
+
+const { createScanner, extract } = require('../api/jdScanner');
+const {
+  option, createRandom, generateJob,
+} = require('./benchUtils');
+
+const SHORT_DOCS = Number(option('short', 20000));
+const LONG_DOCS = Number(option('long', 500));
+const SEED = Number(option('seed', 42));
+const LONG_BYTES = 20 * 1024;
+
+const random = createRandom(SEED);
+
+const shortJd = () => generateJob(random).jd_original;
+
+// Generated sentences joined until the text reaches 20 KB
+const longJd = () => {
+  const parts = [];
+  let length = 0;
+  while (length < LONG_BYTES) {
+    const part = shortJd();
+    parts.push(part);
+    length += part.length + 1;
+  }
+  return parts.join('\n').slice(0, LONG_BYTES);
+};
+
+const scanner = createScanner({ cacheSize: 0 });
+scanner.warmUp();
+console.log(`🧩 Automaton built in ${scanner.stats().automaton_build_ms} ms`);
+
+const elapsedMs = (started) => Number(process.hrtime.bigint() - started) / 1e6;
+
+const summarize = (count, ms, texts) => ({
+  docs: count,
+  avg_kb: Number((texts.reduce((sum, text) => sum + text.length, 0) / texts.length / 1024).toFixed(1)),
+  total_ms: Number(ms.toFixed(1)),
+  docs_per_s: Math.round(count / (ms / 1000)),
+});
+
+const main = async () => {
+  const sets = {
+    short: Array.from({ length: SHORT_DOCS }, shortJd),
+    '20 KB': Array.from({ length: LONG_DOCS }, longJd),
+  };
+
+  const results = {};
+  for (const [name, texts] of Object.entries(sets)) {
+    // Untimed pass so both paths run optimized code and the workers are started
+    texts.slice(0, 50).forEach(extract);
+    await scanner.scanBatch(texts.slice(0, 64));
+
+    let started = process.hrtime.bigint();
+    texts.forEach(extract);
+    results[`${name} extract()`] = summarize(texts.length, elapsedMs(started), texts);
+
+    started = process.hrtime.bigint();
+    await scanner.scanBatch(texts);
+    const batchMs = elapsedMs(started);
+    // With a single CPU the pool is never used and batches run on this thread
+    const { workers } = scanner.stats();
+    results[`${name} scanBatch (${workers ? `${workers} workers` : 'main thread'})`] = summarize(texts.length, batchMs, texts);
+  }
+
+  console.table(results);
+};
+
+main().catch((error) => {
+  console.error('❌ Scan benchmark failed:', error.message);
+  process.exit(1);
+});
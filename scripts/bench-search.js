@@ -0,0 +1,57 @@
+#!/usr/bin/env node
+// Benchmarks GET /api/jd/search's index (api/searchIndex.js) in process.
+//
+// Seeds a store with --docs generated job descriptions, builds the index from
+// store change events the way server.js does, then times each query --runs
+// times, with and without the structured filters the search endpoint accepts.
+// The data comes from --seed, so runs with the same options are comparable.
+//
+// Usage: npm run bench:search -- [--docs 1000000] [--runs 200] [--seed 42]
+
+const { createMemoryStore } = require('../api/store');
+const { createSearchIndex } = require('../api/searchIndex');
+const { buildListFilter } = require('../api/jobList');
+const {
+  option, seedStore, latencySummary, timeRuns, heapMb,
+} = require('./benchUtils');
+
+const DOCS = Number(option('docs', 1000000));
+const RUNS = Number(option('runs', 200));
+const SEED = Number(option('seed', 42));
+
+const QUERIES = ['react', 'python developer', 'aws docker kubernetes', 'kube', 'backend java', 'data spark', 'terraform'];
+
+// Built by api/jobList.js from the query string, as the search endpoint does
+const FILTERS = {
+  none: null,
+  'status=Open&exp_min=3': buildListFilter({ status: 'Open', exp_min: '3' }),
+};
+
+const store = createMemoryStore();
+const searchIndex = createSearchIndex();
+store.onChange((table, change) => {
+  if (table === 'job_descriptions') {
+    searchIndex.apply(change);
+  }
+});
+
+console.log(`📦 Seeding ${DOCS} job descriptions (seed ${SEED})`);
+const started = process.hrtime.bigint();
+seedStore(store, DOCS, SEED);
+const buildMs = Number(process.hrtime.bigint() - started) / 1e6;
+console.log(`⏱️  Seeded and indexed in ${(buildMs / 1000).toFixed(1)}s, heap ${heapMb()} MB, ${searchIndex.stats().terms} terms`);
+
+const results = {};
+const all = [];
+QUERIES.forEach((query) => {
+  Object.entries(FILTERS).forEach(([name, filter]) => {
+    const hits = searchIndex.search(query, { limit: 50, filter }).length;
+    const samples = timeRuns(() => searchIndex.search(query, { limit: 50, filter }), { runs: RUNS });
+    all.push(...samples);
+    results[`${query} [${name}]`] = { hits, ...latencySummary(samples) };
+  });
+});
+
+console.table(results);
+const overall = latencySummary(all);
+console.log(`🔎 All queries: p50 ${overall.p50_ms} ms, p99 ${overall.p99_ms} ms over ${overall.runs} searches`);
@@ -0,0 +1,41 @@
+#!/usr/bin/env node
+// Benchmarks the dashboard summaries (api/jobSummary.js) against a full scan.
+//
+// Seeds a store with --rows generated job descriptions while the running
+// counters follow its change events, as they do in server.js. Then times the
+// summary endpoints' reads from those counters (jobSummary() and
+// customerSummary()) against reconcile(), which rebuilds the same figures
+// from every row the way the SQL views aggregate on each query. The data comes
+// from --seed, so runs with the same options are comparable.
+//
+// Usage: npm run bench:summary -- [--rows 1000000] [--runs 1000] [--scan-runs 10] [--seed 42]
+
+const { createMemoryStore } = require('../api/store');
+const { createJobSummary } = require('../api/jobSummary');
+const {
+  option, seedStore, latencySummary, timeRuns, heapMb,
+} = require('./benchUtils');
+
+const ROWS = Number(option('rows', 1000000));
+const RUNS = Number(option('runs', 1000));
+const SCAN_RUNS = Number(option('scan-runs', 10));
+const SEED = Number(option('seed', 42));
+
+const store = createMemoryStore();
+const summary = createJobSummary(store);
+
+console.log(`📦 Seeding ${ROWS} job descriptions (seed ${SEED})`);
+const started = process.hrtime.bigint();
+seedStore(store, ROWS, SEED);
+const seedMs = Number(process.hrtime.bigint() - started) / 1e6;
+console.log(`⏱️  Seeded with counters attached in ${(seedMs / 1000).toFixed(1)}s, heap ${heapMb()} MB`);
+
+const results = {
+  'jobSummary() from counters': latencySummary(timeRuns(summary.jobSummary, { runs: RUNS })),
+  'customerSummary() from counters': latencySummary(timeRuns(summary.customerSummary, { runs: RUNS })),
+  'reconcile() full scan': latencySummary(timeRuns(summary.reconcile, { runs: SCAN_RUNS, warmup: 1 })),
+};
+
+console.table(results);
+const drift = summary.reconcile();
+console.log(`🔍 Counters match a full scan: ${drift.length === 0 ? 'yes' : `no, ${drift.length} field(s) differ`}`);
@@ -0,0 +1,115 @@
+// Shared pieces for the load test and benchmark scripts: command-line options,
+// seeded job description data and latency summaries.
+
+const option = (name, fallback) => {
+  const args = process.argv.slice(2);
+  const index = args.indexOf(`--${name}`);
+  return index === -1 ? fallback : args[index + 1];
+};
+
+// Small seeded PRNG (mulberry32) so data and request order are repeatable
+const createRandom = (seed) => {
+  let state = seed >>> 0;
+  return () => {
+    state = (state + 0x6d2b79f5) >>> 0;
+    let t = state;
+    t = Math.imul(t ^ (t >>> 15), t | 1);
+    t ^= t + Math.imul(t ^ (t >>> 7), t | 61);
+    return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+  };
+};
+
+const SKILLS = ['React', 'Node.js', 'Python', 'Java', 'AWS', 'Docker', 'Kubernetes', 'SQL', 'TypeScript', 'Go', 'Spark', 'Terraform'];
+const TITLES = ['Frontend Developer', 'Backend Engineer', 'Full Stack Developer', 'DevOps Engineer', 'Data Scientist', 'Mobile Developer'];
+const STATUSES = ['Open', 'In Progress', 'On Hold', 'Closed'];
+const DUTIES = [
+  'You will design, build and maintain services used by thousands of customers.',
+  'The role involves code reviews, mentoring and close work with product owners.',
+  'You will own features end to end, from design through testing and release.',
+  'Experience with agile delivery, CI/CD pipelines and automated testing is a plus.',
+  'Strong communication skills and a client-facing background are preferred.',
+];
+
+const pick = (random, items) => items[Math.floor(random() * items.length)];
+
+// A valid job description (passes api/validation.js)
+const generateJob = (random) => {
+  const skills = [...new Set(Array.from({ length: 2 + Math.floor(random() * 4) }, () => pick(random, SKILLS)))];
+  const expMin = 1 + Math.floor(random() * 8);
+  const budgetMin = 5 + Math.floor(random() * 30);
+  return {
+    jd_title: pick(random, TITLES),
+    jd_customer_id: 1 + Math.floor(random() * 3),
+    jd_consumer: 'Load Test',
+    jd_original: `We are looking for a ${pick(random, TITLES)} with ${expMin}+ years of experience in ${skills.join(', ')}. ${pick(random, DUTIES)} ${pick(random, DUTIES)}`,
+    jd_skillset_cat: 1 + Math.floor(random() * 6),
+    jd_skillset: skills,
+    jd_mode: 1 + Math.floor(random() * 5),
+    jd_tenure: 3 + Math.floor(random() * 22),
+    jd_op_exp_min: expMin,
+    jd_op_exp_max: expMin + 1 + Math.floor(random() * 5),
+    jd_op_budget_min: budgetMin,
+    jd_op_budget_max: budgetMin + 1 + Math.floor(random() * 20),
+    jd_open_position: 1 + Math.floor(random() * 5),
+    jd_created_by: 1 + Math.floor(random() * 4),
+    jd_status: pick(random, STATUSES),
+  };
+};
+
+// Fills `store` with `count` generated job descriptions, in batches like the importer
+const seedStore = (store, count, seed) => {
+  const random = createRandom(seed);
+  for (let i = 0; i < count; i += 10000) {
+    const batch = [];
+    for (let j = i; j < Math.min(count, i + 10000); j++) {
+      batch.push(generateJob(random));
+    }
+    store.insertJobs(batch);
+  }
+};
+
+const percentile = (sorted, p) => (sorted.length ? sorted[Math.min(sorted.length - 1, Math.floor(sorted.length * p))] : 0);
+
+// p50/p95/p99/max of a list of millisecond timings
+const latencySummary = (samples) => {
+  const sorted = [...samples].sort((a, b) => a - b);
+  const round = (value) => Number(value.toFixed(3));
+  return {
+    runs: sorted.length,
+    p50_ms: round(percentile(sorted, 0.5)),
+    p95_ms: round(percentile(sorted, 0.95)),
+    p99_ms: round(percentile(sorted, 0.99)),
+    max_ms: round(sorted[sorted.length - 1] || 0),
+  };
+};
+
+// Runs fn `runs` times after `warmup` untimed calls and returns the timings
+const timeRuns = (fn, { runs = 100, warmup = 5 } = {}) => {
+  for (let i = 0; i < warmup; i++) {
+    fn();
+  }
+  const samples = [];
+  for (let i = 0; i < runs; i++) {
+    const started = process.hrtime.bigint();
+    fn();
+    samples.push(Number(process.hrtime.bigint() - started) / 1e6);
+  }
+  return samples;
+};
+
+const heapMb = () => Number((process.memoryUsage().heapUsed / 1048576).toFixed(1));
+
+module.exports = {
+  option,
+  createRandom,
+  pick,
+  generateJob,
+  seedStore,
+  percentile,
+  latencySummary,
+  timeRuns,
+  heapMb,
+  SKILLS,
+  TITLES,
+  STATUSES,
+};
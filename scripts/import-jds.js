@@ -0,0 +1,50 @@
+#!/usr/bin/env node
+// Streams a CSV or JSONL file of job descriptions to POST /api/jd/import.
+//
+// Usage: npm run import -- <file> [--format csv|jsonl] [--url http://localhost:3001]
+
+const fs = require('fs');
+const http = require('http');
+const path = require('path');
+
+const args = process.argv.slice(2);
+const option = (name, fallback) => {
+  const index = args.indexOf(`--${name}`);
+  return index === -1 ? fallback : args[index + 1];
+};
+
+const file = args.find((arg, index) => !arg.startsWith('--') && !(index > 0 && args[index - 1].startsWith('--')));
+if (!file) {
+  console.error('Usage: npm run import -- <file> [--format csv|jsonl] [--url http://localhost:3001]');
+  process.exit(1);
+}
+
+const format = option('format', path.extname(file).toLowerCase() === '.jsonl' ? 'jsonl' : 'csv');
+const url = new URL(`/api/jd/import?format=${format}`, option('url', `http://localhost:${process.env.PORT || 3001}`));
+
+const req = http.request(url, {
+  method: 'POST',
+  headers: { 'Content-Type': format === 'jsonl' ? 'application/x-ndjson' : 'text/csv' },
+}, (res) => {
+  let body = '';
+  res.setEncoding('utf8');
+  res.on('data', (chunk) => {
+    body += chunk;
+  });
+  res.on('end', () => {
+    const { message, data } = JSON.parse(body);
+    console.log(`📦 ${message}`);
+    if (data) {
+      console.log(`⏱️  ${data.elapsed_ms} ms, ${data.rows_per_second} rows/s`);
+      data.errors.forEach(({ line, errors }) => console.log(`❌ Line ${line}: ${errors.join('; ')}`));
+    }
+    process.exit(res.statusCode < 400 ? 0 : 1);
+  });
+});
+
+req.on('error', (error) => {
+  console.error('❌ Import failed:', error.message);
+  process.exit(1);
+});
+
+fs.createReadStream(file).pipe(req);
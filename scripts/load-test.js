@@ -0,0 +1,193 @@
+#!/usr/bin/env node
+// Drives the mock API with a fixed mix of JD requests and reports latency per
+// endpoint, to get a baseline before and after performance changes.
+//
+// Starts its own server on --port, seeds it with --rows generated job
+// descriptions through /api/jd/import, then runs --concurrency clients for
+// --duration seconds. Data and request order come from --seed, so runs with
+// the same options are comparable. Pass --url to test a server that is
+// already running (it is seeded the same way).
+//
+// Usage: npm run load-test -- [--rows 5000] [--concurrency 16] [--duration 10]
+//                             [--seed 42] [--port 3101] [--url http://...] [--out report.json]
+
+const fs = require('fs');
+const http = require('http');
+const path = require('path');
+const { spawn } = require('child_process');
+
+const {
+  option, createRandom, pick, generateJob, percentile, STATUSES,
+} = require('./benchUtils');
+
+const args = process.argv.slice(2);
+
+const ROWS = Number(option('rows', 5000));
+const CONCURRENCY = Number(option('concurrency', 16));
+const DURATION_MS = Number(option('duration', 10)) * 1000;
+const SEED = Number(option('seed', 42));
+const PORT = Number(option('port', 3101));
+const OUT = option('out', null);
+const baseUrl = new URL(option('url', `http://localhost:${PORT}`));
+
+const SEARCH_TERMS = ['react', 'python developer', 'aws docker', 'kube', 'backend java', 'data spark'];
+
+const agent = new http.Agent({ keepAlive: true, maxSockets: CONCURRENCY });
+
+const request = (method, pathname, body = null, headers = {}) => new Promise((resolve, reject) => {
+  const req = http.request(new URL(pathname, baseUrl), { method, agent, headers }, (res) => {
+    const chunks = [];
+    res.on('data', (chunk) => chunks.push(chunk));
+    res.on('end', () => resolve({ status: res.statusCode, body: Buffer.concat(chunks).toString('utf8') }));
+  });
+  req.on('error', reject);
+  req.end(body);
+});
+
+const waitForServer = async () => {
+  for (let attempt = 0; attempt < 50; attempt++) {
+    try {
+      await request('GET', '/health');
+      return;
+    } catch (error) {
+      await new Promise((resolve) => setTimeout(resolve, 100));
+    }
+  }
+  throw new Error(`Server at ${baseUrl.origin} did not come up`);
+};
+
+const seed = async () => {
+  const random = createRandom(SEED);
+  const lines = Array.from({ length: ROWS }, () => JSON.stringify(generateJob(random)));
+  const res = await request('POST', '/api/jd/import?format=jsonl', `${lines.join('\n')}\n`, {
+    'Content-Type': 'application/x-ndjson',
+  });
+  const { data } = JSON.parse(res.body);
+  return data;
+};
+
+// Request mix: [name, weight, (random, state) => [method, path, body?]]
+const SCENARIOS = [
+  ['list', 25, () => ['GET', '/api/jd?limit=50']],
+  ['list_next_page', 10, (random, state) => ['GET', `/api/jd?limit=50${state.cursor ? `&cursor=${state.cursor}` : ''}`]],
+  ['list_filtered', 10, (random) => ['GET', `/api/jd?status=${encodeURIComponent(pick(random, STATUSES))}&exp_min=3&limit=50`]],
+  ['get', 20, (random) => ['GET', `/api/jd/${1 + Math.floor(random() * ROWS)}`]],
+  ['search', 15, (random) => ['GET', `/api/jd/search?q=${encodeURIComponent(pick(random, SEARCH_TERMS))}&limit=20`]],
+  ['reference', 10, () => ['GET', '/api/reference']],
+  ['summary', 5, () => ['GET', '/api/jd/summary']],
+  ['scan', 5, (random) => ['POST', '/api/jd/scan', JSON.stringify({ jd_text: generateJob(random).jd_original })]],
+];
+const TOTAL_WEIGHT = SCENARIOS.reduce((sum, [, weight]) => sum + weight, 0);
+
+const chooseScenario = (random) => {
+  let roll = random() * TOTAL_WEIGHT;
+  return SCENARIOS.find(([, weight]) => (roll -= weight) < 0) || SCENARIOS[0];
+};
+
+const runClients = async () => {
+  const results = Object.fromEntries(SCENARIOS.map(([name]) => [name, { latencies: [], errors: 0 }]));
+  const deadline = Date.now() + DURATION_MS;
+
+  const client = async (index) => {
+    const random = createRandom(SEED + index + 1);
+    const state = { cursor: null };
+    while (Date.now() < deadline) {
+      const [name, , build] = chooseScenario(random);
+      const [method, pathname, body] = build(random, state);
+      const started = process.hrtime.bigint();
+      try {
+        const res = await request(method, pathname, body, body ? { 'Content-Type': 'application/json' } : {});
+        results[name].latencies.push(Number(process.hrtime.bigint() - started) / 1e6);
+        if (res.status >= 400) {
+          results[name].errors += 1;
+        } else if (name.startsWith('list')) {
+          state.cursor = JSON.parse(res.body).next_cursor;
+        }
+      } catch (error) {
+        results[name].errors += 1;
+      }
+    }
+  };
+
+  await Promise.all(Array.from({ length: CONCURRENCY }, (_, index) => client(index)));
+  return results;
+};
+
+// Average store queries per request by route, from /metrics
+const queriesPerRequest = (text) => {
+  const sums = {};
+  const counts = {};
+  text.split('\n').forEach((line) => {
+    const match = line.match(/^rectool_http_request_store_queries_(sum|count)\{method="(\w+)",route="([^"]*)"\} (\S+)/);
+    if (match) {
+      const [, kind, method, route, value] = match;
+      (kind === 'sum' ? sums : counts)[`${method} ${route}`] = Number(value);
+    }
+  });
+  return Object.fromEntries(Object.keys(counts).map((key) => [key, Number((sums[key] / counts[key]).toFixed(2))]));
+};
+
+const main = async () => {
+  let server = null;
+  if (!args.includes('--url')) {
+    server = spawn(process.execPath, [path.join(__dirname, '..', 'server.js')], {
+      env: { ...process.env, PORT: String(PORT) },
+      stdio: 'ignore',
+    });
+  }
+
+  try {
+    await waitForServer();
+    const imported = await seed();
+    console.log(`📦 Seeded ${imported.imported} job descriptions (${imported.rows_per_second} rows/s)`);
+    console.log(`🚦 ${CONCURRENCY} clients for ${DURATION_MS / 1000}s, seed ${SEED}`);
+
+    const started = Date.now();
+    const results = await runClients();
+    const elapsed = (Date.now() - started) / 1000;
+
+    const endpoints = Object.fromEntries(Object.entries(results).map(([name, { latencies, errors }]) => {
+      const sorted = latencies.sort((a, b) => a - b);
+      return [name, {
+        requests: sorted.length,
+        errors,
+        rps: Number((sorted.length / elapsed).toFixed(1)),
+        p50_ms: Number(percentile(sorted, 0.5).toFixed(2)),
+        p95_ms: Number(percentile(sorted, 0.95).toFixed(2)),
+        p99_ms: Number(percentile(sorted, 0.99).toFixed(2)),
+        max_ms: Number((sorted[sorted.length - 1] || 0).toFixed(2)),
+      }];
+    }));
+    const total = Object.values(endpoints).reduce((sum, { requests }) => sum + requests, 0);
+
+    console.table(endpoints);
+    console.log(`⏱️  ${total} requests in ${elapsed.toFixed(1)}s (${(total / elapsed).toFixed(1)} req/s)`);
+
+    const metricsText = (await request('GET', '/metrics')).body;
+    const storeQueries = queriesPerRequest(metricsText);
+    console.log('🗄️  Store queries per request:', storeQueries);
+
+    if (OUT) {
+      const report = {
+        options: { rows: ROWS, concurrency: CONCURRENCY, duration_s: DURATION_MS / 1000, seed: SEED },
+        node: process.version,
+        total_requests: total,
+        rps: Number((total / elapsed).toFixed(1)),
+        endpoints,
+        store_queries_per_request: storeQueries,
+      };
+      fs.writeFileSync(OUT, `${JSON.stringify(report, null, 2)}\n`);
+      console.log(`📝 Report written to ${OUT}`);
+    }
+  } finally {
+    agent.destroy();
+    if (server) {
+      server.kill();
+    }
+  }
+};
+
+main().catch((error) => {
+  console.error('❌ Load test failed:', error.message);
+  process.exit(1);
+});
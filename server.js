@@ -1,26 +1,105 @@
 const express = require('express');
 const cors = require('cors');
+const { createMemoryStore } = require('./api/store');
+const { createReferenceCache } = require('./api/referenceCache');
+const { createSearchIndex } = require('./api/searchIndex');
+const { importJobs } = require('./api/bulkImport');
+const { createScanner } = require('./api/jdScanner');
+const { createJobSummary } = require('./api/jobSummary');
+const { streamExport, EXPORT_FORMATS } = require('./api/jdExport');
+const { createMetrics } = require('./api/metrics');
+const {
+  decodeCursor,
+  seekCursor,
+  validateListQuery,
+  buildListFilter,
+  withAging,
+  buildProjection,
+  parseLimit,
+  listPage,
+  exportChunks,
+} = require('./api/jobList');
 const app = express();
 const PORT = process.env.PORT || 3001;
 
+// Request metrics go first so body parsing counts towards latency
+const metrics = createMetrics();
+app.use(metrics.middleware);
+
 // Middleware
 app.use(cors({
   origin: 'http://localhost:3000', // Change if frontend runs elsewhere
-  methods: ['GET', 'POST'],
-  allowedHeaders: ['Content-Type'],
+  methods: ['GET', 'POST', 'PUT', 'DELETE'],
+  allowedHeaders: ['Content-Type', 'X-Profile'],
 }));
+// Batch scans carry many full JD texts, more than the 100kb default allows.
+// Parsed here first, the body is skipped by the default parser below.
+app.use('/api/jd/scan/batch', express.json({ limit: process.env.SCAN_BATCH_BODY_LIMIT || '5mb' }));
 app.use(express.json());
+app.use(metrics.restoreContext);
 
 // Mock data storage (in memory)
-let jobDescriptions = [];
+const store = createMemoryStore({ onQuery: metrics.onQuery });
+const jobDescriptions = store.jobs;
+const referenceCache = createReferenceCache(store, {
+  ttlMs: Number(process.env.REFERENCE_CACHE_TTL_MS) || undefined,
+});
+const jobSummary = createJobSummary(store);
+
+// Counters are kept up to date on every write; this catches any drift
+const SUMMARY_RECONCILE_MS = Number(process.env.SUMMARY_RECONCILE_MS) || 10 * 60 * 1000;
+setInterval(() => {
+  const drift = jobSummary.reconcile();
+  if (drift.length > 0) {
+    console.warn(`⚠️ Job summary drift corrected in ${drift.length} field(s)`, drift);
+  }
+}, SUMMARY_RECONCILE_MS).unref();
+
+const scanner = createScanner({
+  cacheSize: Number(process.env.SCAN_CACHE_SIZE) || undefined,
+});
+scanner.warmUp();
+const searchIndex = createSearchIndex();
+store.onChange((table, change) => {
+  if (table === 'job_descriptions') {
+    searchIndex.apply(change);
+  }
+});
 
-// GET endpoint to retrieve all job descriptions
+// GET endpoint to retrieve a page of job descriptions, newest first.
+// Supports `limit`, `cursor` (from the previous page's `next_cursor`), the filters
+// in api/jobList.js, `aging_min`/`aging_max` in days and a sparse `fields=` projection.
 app.get('/api/jd', (req, res) => {
   try {
+    const queryError = validateListQuery(req.query);
+    if (queryError) {
+      return res.status(400).json({
+        success: false,
+        message: queryError,
+        data: null,
+      });
+    }
+
+    const { cursor } = req.query;
+    let start = jobDescriptions.length;
+    if (cursor) {
+      try {
+        start = seekCursor(jobDescriptions, decodeCursor(cursor));
+      } catch (error) {
+        return res.status(400).json({
+          success: false,
+          message: 'Invalid cursor',
+          data: null,
+        });
+      }
+    }
+
+    const { data, next_cursor: nextCursor } = listPage(jobDescriptions, req.query, { start });
     res.json({
       success: true,
-      data: jobDescriptions,
-      count: jobDescriptions.length
+      data,
+      count: data.length,
+      next_cursor: nextCursor
     });
   } catch (error) {
     res.status(500).json({
@@ -31,11 +110,136 @@ app.get('/api/jd', (req, res) => {
   }
 });
 
+// Full-text search over title, original text, skills and keywords, ranked by
+// BM25. Accepts the same filters as the list endpoint.
+app.get('/api/jd/search', (req, res) => {
+  try {
+    const { q, fields } = req.query;
+    if (!q || !String(q).trim()) {
+      return res.status(400).json({
+        success: false,
+        message: 'Query parameter q is required',
+        data: null,
+      });
+    }
+
+    const queryError = validateListQuery(req.query);
+    if (queryError) {
+      return res.status(400).json({
+        success: false,
+        message: queryError,
+        data: null,
+      });
+    }
+
+    const limit = parseLimit(req.query.limit);
+    const filter = buildListFilter(req.query);
+    const project = buildProjection(fields, new Date());
+    // The index holds the current rows, so neither filtering nor projecting
+    // the results goes back to the store
+    const results = searchIndex.search(String(q), { limit, filter });
+
+    const data = results.map(({ row, score }) => ({
+      ...project(row),
+      score: Number(score.toFixed(4)),
+    }));
+
+    res.json({
+      success: true,
+      data,
+      count: data.length
+    });
+  } catch (error) {
+    res.status(500).json({
+      success: false,
+      message: 'Failed to search job descriptions',
+      error: error.message
+    });
+  }
+});
+
+// Streams every job description matching the list filters as CSV, XLSX or JSONL
+app.get('/api/jd/export', async (req, res) => {
+  try {
+    const format = req.query.format || 'csv';
+    if (!EXPORT_FORMATS[format]) {
+      return res.status(400).json({
+        success: false,
+        message: `Unsupported export format: ${format}`,
+        data: null,
+      });
+    }
+    const queryError = validateListQuery(req.query);
+    if (queryError) {
+      return res.status(400).json({
+        success: false,
+        message: queryError,
+        data: null,
+      });
+    }
+
+    const now = new Date();
+
+    const { contentType, extension } = EXPORT_FORMATS[format];
+    res.status(200).set({
+      'Content-Type': contentType,
+      'Content-Disposition': `attachment; filename="job-descriptions-${now.toISOString().slice(0, 10)}.${extension}"`,
+      'Cache-Control': 'no-store',
+    });
+
+    await streamExport(res, exportChunks(jobDescriptions, req.query, { now }), { format, store, now });
+  } catch (error) {
+    console.error('❌ Error exporting job descriptions:', error);
+    if (res.headersSent) {
+      return res.destroy(error);
+    }
+    res.status(500).json({
+      success: false,
+      message: 'Failed to export job descriptions',
+      data: null,
+    });
+  }
+});
+
+// Dashboard totals, same figures as the v_job_summary view
+app.get('/api/jd/summary', (req, res) => {
+  try {
+    res.json({
+      success: true,
+      data: jobSummary.jobSummary()
+    });
+  } catch (error) {
+    res.status(500).json({
+      success: false,
+      message: 'Failed to load job summary',
+      error: error.message
+    });
+  }
+});
+
+// Per-customer totals, same figures as the v_customer_job_summary view
+app.get('/api/customers/summary', (req, res) => {
+  try {
+    const data = jobSummary.customerSummary();
+    res.json({
+      success: true,
+      data,
+      count: data.length
+    });
+  } catch (error) {
+    res.status(500).json({
+      success: false,
+      message: 'Failed to load customer summary',
+      error: error.message
+    });
+  }
+});
+
 // GET endpoint to retrieve a specific job description by ID
 app.get('/api/jd/:id', (req, res) => {
   try {
     const { id } = req.params;
-    const jobDescription = jobDescriptions.find(jd => jd.id == id);
+    const jobDescription = store.getJob(id);
     
     if (!jobDescription) {
       return res.status(404).json({
@@ -47,7 +251,7 @@ app.get('/api/jd/:id', (req, res) => {
     
     res.json({
       success: true,
-      data: jobDescription
+      data: withAging(jobDescription, new Date())
     });
   } catch (error) {
     res.status(500).json({
@@ -58,6 +262,120 @@ app.get('/api/jd/:id', (req, res) => {
   }
 });
 
+// Aging is computed on read, so there is nothing to rewrite; kept for clients
+// that still call it after bulk changes
+app.post('/api/jd/update-aging', (req, res) => {
+  res.json({
+    success: true,
+    message: 'JD aging is computed on read',
+    data: { rows_touched: 0 },
+  });
+});
+
+// Bulk import endpoint. The request body is the raw CSV or JSONL file, read as
+// a stream; `format` comes from the query string or the Content-Type.
+app.post('/api/jd/import', async (req, res) => {
+  try {
+    const contentType = req.get('Content-Type') || '';
+    const format = req.query.format || (contentType.includes('ndjson') || contentType.includes('jsonl') ? 'jsonl' : 'csv');
+    if (!['csv', 'jsonl'].includes(format)) {
+      return res.status(400).json({
+        success: false,
+        message: `Unsupported import format: ${format}`,
+        data: null,
+      });
+    }
+
+    req.setEncoding('utf8');
+    const summary = await importJobs(req, store, {
+      format,
+      chunkSize: parseInt(req.query.chunk_size, 10) || undefined,
+    });
+
+    console.log(`📦 Imported ${summary.imported}/${summary.total} job descriptions (${summary.rows_per_second} rows/s)`);
+    res.status(summary.imported > 0 ? 201 : 400).json({
+      success: summary.failed === 0,
+      message: `Imported ${summary.imported} of ${summary.total} job descriptions`,
+      data: summary,
+    });
+  } catch (error) {
+    console.error('❌ Error importing job descriptions:', error);
+    res.status(500).json({
+      success: false,
+      message: 'Internal server error',
+      data: null,
+    });
+  }
+});
+
+// Scanner results name the mode and category; the JD form wants their ids as strings
+const toFormFields = ({ mode_name: modeName, category_name: categoryName, ...fields }) => {
+  const data = { ...fields };
+  const mode = modeName && store.listTable('engagement_modes').find((row) => row.mode_name === modeName);
+  if (mode) {
+    data.jd_mode = String(mode.mode_id);
+  }
+  const category = categoryName && store.listTable('skillset_categories').find((row) => row.category_name === categoryName);
+  if (category) {
+    data.jd_skillset_cat = String(category.category_id);
+  }
+  return data;
+};
+
+// Extracts skills, keywords, experience, budget, tenure and mode from JD text
+app.post('/api/jd/scan', (req, res) => {
+  try {
+    const { jd_text: jdText } = req.body;
+    if (!jdText || !String(jdText).trim()) {
+      return res.status(400).json({
+        success: false,
+        message: 'jd_text is required',
+        data: null,
+      });
+    }
+
+    res.json({
+      success: true,
+      data: toFormFields(scanner.scan(String(jdText)))
+    });
+  } catch (error) {
+    console.error('❌ Error scanning job description:', error);
+    res.status(500).json({
+      success: false,
+      message: 'Failed to scan job description',
+      data: null,
+    });
+  }
+});
+
+// Scans many JD texts at once; results are returned in request order
+app.post('/api/jd/scan/batch', async (req, res) => {
+  try {
+    const { texts } = req.body;
+    if (!Array.isArray(texts)) {
+      return res.status(400).json({
+        success: false,
+        message: 'texts must be an array of JD texts',
+        data: null,
+      });
+    }
+
+    const results = await scanner.scanBatch(texts.map((text) => String(text || '')));
+    res.json({
+      success: true,
+      data: results.map(toFormFields),
+      count: results.length
+    });
+  } catch (error) {
+    console.error('❌ Error scanning job descriptions:', error);
+    res.status(500).json({
+      success: false,
+      message: 'Failed to scan job descriptions',
+      data: null,
+    });
+  }
+});
+
 // Mock API endpoint
 app.post('/api/jd', (req, res) => {
   try {
@@ -79,17 +397,10 @@ app.post('/api/jd', (req, res) => {
 
     // Simulate processing delay
     setTimeout(() => {
-      console.log('📥 Received Job Description:', JSON.stringify(jobData, null, 2));
+      console.log(`📥 Received Job Description: ${jobData.jd_title}`);
 
       // Create new job description with ID
-      const newJobDescription = {
-        id: Date.now(),
-        ...jobData,
-        created_at: new Date().toISOString(),
-      };
-
-      // Store in mock data
-      jobDescriptions.push(newJobDescription);
+      const newJobDescription = store.insertJob(jobData, jobData.jd_created_by);
 
       res.status(201).json({
         success: true,
@@ -108,15 +419,136 @@ app.post('/api/jd', (req, res) => {
   }
 });
 
+// PUT endpoint to update a job description
+app.put('/api/jd/:id', (req, res) => {
+  try {
+    const updated = store.updateJob(req.params.id, req.body, req.body.jd_updated_by);
+
+    if (!updated) {
+      return res.status(404).json({
+        success: false,
+        message: 'Job description not found',
+        data: null
+      });
+    }
+
+    res.json({
+      success: true,
+      message: 'Job Description updated successfully',
+      data: withAging(updated, new Date())
+    });
+  } catch (error) {
+    console.error('❌ Error updating job description:', error);
+    res.status(500).json({
+      success: false,
+      message: 'Internal server error',
+      data: null,
+    });
+  }
+});
+
+// PUT endpoint to change a job's status, recording it in the status history
+app.put('/api/jd/:id/status', (req, res) => {
+  try {
+    const { status, notes, changed_by: changedBy } = req.body;
+    if (!status) {
+      return res.status(400).json({
+        success: false,
+        message: 'status is required',
+        data: null,
+      });
+    }
+
+    const updated = store.updateJobStatus(req.params.id, status, notes, changedBy);
+    if (!updated) {
+      return res.status(404).json({
+        success: false,
+        message: 'Job description not found',
+        data: null
+      });
+    }
+
+    res.json({
+      success: true,
+      message: 'Status updated successfully',
+      data: withAging(updated, new Date())
+    });
+  } catch (error) {
+    console.error('❌ Error updating job status:', error);
+    res.status(500).json({
+      success: false,
+      message: 'Internal server error',
+      data: null,
+    });
+  }
+});
+
+// DELETE endpoint to remove a job description
+app.delete('/api/jd/:id', (req, res) => {
+  try {
+    const deleted = store.deleteJob(req.params.id);
+
+    if (!deleted) {
+      return res.status(404).json({
+        success: false,
+        message: 'Job description not found',
+        data: null
+      });
+    }
+
+    res.json({
+      success: true,
+      message: 'Job Description deleted successfully',
+      data: { id: deleted.id }
+    });
+  } catch (error) {
+    console.error('❌ Error deleting job description:', error);
+    res.status(500).json({
+      success: false,
+      message: 'Internal server error',
+      data: null,
+    });
+  }
+});
+
+// Reference data endpoints (/api/categories, /api/modes, ...) and the combined
+// /api/reference bundle, served from the reference cache
+referenceCache.resources.forEach((name) => {
+  app.get(`/api/${name}`, referenceCache.handler(name));
+});
+app.get(`/api/${referenceCache.bundle}`, referenceCache.handler(referenceCache.bundle));
+
 // Health check endpoint
 app.get('/health', (req, res) => {
   res.json({
     status: 'OK',
     timestamp: new Date().toISOString(),
-    uptime: process.uptime()
+    uptime: process.uptime(),
+    store: store.stats(),
+    reference_cache: referenceCache.stats(),
+    search_index: searchIndex.stats(),
+    scanner: scanner.stats(),
+    job_summary: jobSummary.stats()
   });
 });
 
+// Prometheus metrics (see api/metrics.js)
+app.get('/metrics', (req, res) => {
+  const caches = { reference: referenceCache.stats(), scanner: scanner.stats() };
+  const cacheLines = [
+    '# HELP rectool_cache_lookups_total Cache lookups by cache and result',
+    '# TYPE rectool_cache_lookups_total counter',
+    ...Object.entries(caches).flatMap(([cache, stats]) => [
+      `rectool_cache_lookups_total{cache="${cache}",result="hit"} ${stats.hits}`,
+      `rectool_cache_lookups_total{cache="${cache}",result="miss"} ${stats.misses}`,
+    ]),
+    '# HELP rectool_job_descriptions Job descriptions in the store',
+    '# TYPE rectool_job_descriptions gauge',
+    `rectool_job_descriptions ${jobDescriptions.length}`,
+  ];
+  res.type('text/plain; version=0.0.4').send(metrics.render(cacheLines));
+});
+
 // Error handling middleware
 app.use((err, req, res, next) => {
   console.error('❌ Unhandled error:', err);